@@ -0,0 +1,228 @@
+import sys
+import json
+import uuid
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from auto_startup_builder import run_pipeline, run_required_pipeline
+from run_store import RunStore, IdempotencyConflict, fingerprint
+from scheduler import QueueFull, LANES
+
+API_VERSION = "v1"
+MAX_BODY_BYTES = 1 << 20
+MAX_BATCH_ITEMS = 100
+BATCH_WORKERS = 4
+IDEMPOTENCY_WAIT = 300
+DEFAULT_TENANT = "default"
+PIPELINES = {"fusion": run_pipeline, "required": run_required_pipeline}
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _parse_item(item):
+    if not isinstance(item, dict):
+        raise ApiError(400, "each run must be a JSON object")
+    idea = item.get("idea")
+    if not isinstance(idea, str) or not idea.strip():
+        raise ApiError(400, "'idea' is required")
+    pipeline = item.get("pipeline", "fusion")
+    if pipeline not in PIPELINES:
+        raise ApiError(400, f"'pipeline' must be one of {sorted(PIPELINES)}")
+    for key in ("language", "tone"):
+        if item.get(key) is not None and not isinstance(item[key], str):
+            raise ApiError(400, f"'{key}' must be a string")
+    return {
+        "idea": idea,
+        "language": item.get("language") or ("English" if pipeline == "fusion" else "EN"),
+        "tone": item.get("tone"),
+        "pipeline": pipeline,
+    }
+
+def _direct(fn, *args):
+    return fn(*args)
+
+def _scheduled(scheduler, tenant, lane):
+    def run(fn, *args):
+        try:
+            fut = scheduler.submit(tenant, lane, fn, *args)
+        except QueueFull as e:
+            raise ApiError(429, str(e))
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return fut.result()
+    return run
+
+def execute(store, request, key=None, runner=_direct, pipelines=PIPELINES):
+    # returns (record, replayed)
+    entry = None
+    while key:
+        try:
+            entry, owner = store.claim(key, fingerprint(request))
+        except IdempotencyConflict as e:
+            raise ApiError(422, str(e))
+        if owner:
+            break
+        if not entry["done"].wait(IDEMPOTENCY_WAIT):
+            raise ApiError(409, "a request with this idempotency key is still in progress")
+        rec = store.get(entry["run_id"]) if entry["run_id"] else None
+        if rec is not None:
+            return rec, True
+        # the original run failed or its result is gone; drop the stale key and claim it again
+        store.release(key, entry)
+    try:
+        result = runner(pipelines[request["pipeline"]], request["idea"], request["language"], request["tone"])
+        rec = store.put(uuid.uuid4().hex, request, result)
+    except Exception as e:
+        if entry is not None:
+            store.finish(key, entry, error=str(e))
+        raise
+    if entry is not None:
+        store.finish(key, entry, run_id=rec["run_id"])
+    return rec, False
+
+def _batch(store, items, include_results, runner=_direct, pipelines=PIPELINES):
+    def one(item):
+        try:
+            req = _parse_item(item)
+            rec, replayed = execute(store, req, item.get("idempotency_key"), runner, pipelines)
+        except ApiError as e:
+            return {"status": "error", "code": e.status, "error": str(e)}
+        except Exception as e:
+            return {"status": "error", "code": 500, "error": str(e)}
+        out = {"status": "done", "run_id": rec["run_id"], "replayed": replayed, "etag": rec["etag"]}
+        if include_results:
+            out["result"] = json.loads(rec["body"])["result"]
+        return out
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(items))) as ex:
+        return list(ex.map(one, items))
+
+def make_handler(store, scheduler=None, similar=None):
+    prefix = f"/{API_VERSION}"
+    # the similarity index is in-memory, so reuse is shared by the threads of this server only
+    pipelines = dict(PIPELINES, fusion=functools.partial(run_pipeline, similar=similar)) if similar is not None else PIPELINES
+
+    class ApiHandler(BaseHTTPRequestHandler):
+        server_version = "AutoFusionAPI/1.0"
+
+        def _json(self, status, payload, headers=None):
+            body = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def _body(self):
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                raise ApiError(400, "invalid Content-Length")
+            if length < 0:
+                raise ApiError(400, "invalid Content-Length")
+            if length > MAX_BODY_BYTES:
+                raise ApiError(413, "request body too large")
+            try:
+                return json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                raise ApiError(400, "request body must be valid JSON")
+
+        def _runner(self, lane):
+            if scheduler is None:
+                return _direct
+            tenant = self.headers.get("X-Tenant-Id") or DEFAULT_TENANT
+            priority = self.headers.get("X-Priority") or lane
+            # clients may move work down to the batch lane, never up into the interactive one
+            if priority in LANES and LANES.index(priority) < LANES.index(lane):
+                raise ApiError(403, f"X-Priority cannot raise {lane} work to the {priority} lane")
+            return _scheduled(scheduler, tenant, priority)
+
+        def _dispatch(self, handler):
+            try:
+                handler(urlsplit(self.path).path.rstrip("/"))
+            except ApiError as e:
+                self._json(e.status, {"error": str(e)})
+            except Exception as e:
+                print(f"api error: {e}", file=sys.stderr)
+                self._json(500, {"error": "internal error"})
+
+        def _get(self, path):
+            if path == f"{prefix}/health":
+                return self._json(200, {"status": "ok", "version": API_VERSION})
+            if path == f"{prefix}/metrics":
+                if scheduler is None:
+                    raise ApiError(404, "scheduler not enabled")
+                return self._json(200, scheduler.metrics())
+            if path.startswith(f"{prefix}/runs/"):
+                rec = store.get(path[len(prefix)+6:])
+                if rec is None:
+                    raise ApiError(404, "run not found")
+                inm = self.headers.get("If-None-Match", "")
+                headers = {"ETag": rec["etag"], "Cache-Control": "private, max-age=0, must-revalidate"}
+                if rec["etag"] in [t.strip() for t in inm.split(",")]:
+                    self.send_response(304)
+                    for k, v in headers.items():
+                        self.send_header(k, v)
+                    self.end_headers()
+                    return
+                return self._json(200, rec["body"], headers)
+            raise ApiError(404, "not found")
+
+        def _post(self, path):
+            if path == f"{prefix}/runs":
+                req = _parse_item(self._body())
+                rec, replayed = execute(store, req, self.headers.get("Idempotency-Key"), self._runner("interactive"), pipelines)
+                headers = {"ETag": rec["etag"], "Location": f"{prefix}/runs/{rec['run_id']}"}
+                if replayed:
+                    headers["Idempotent-Replayed"] = "true"
+                return self._json(200 if replayed else 201, rec["body"], headers)
+            if path == f"{prefix}/batch":
+                body = self._body()
+                items = body.get("runs") if isinstance(body, dict) else None
+                if not isinstance(items, list) or not items:
+                    raise ApiError(400, "'runs' must be a non-empty list")
+                if len(items) > MAX_BATCH_ITEMS:
+                    raise ApiError(413, f"batch limited to {MAX_BATCH_ITEMS} runs")
+                runs = _batch(store, items, bool(body.get("include_results")), self._runner("batch"), pipelines)
+                return self._json(200, {"runs": runs})
+            raise ApiError(404, "not found")
+
+        def do_GET(self):
+            self._dispatch(self._get)
+
+        def do_HEAD(self):
+            self._dispatch(self._get)
+
+        def do_POST(self):
+            self._dispatch(self._post)
+
+        def log_message(self, fmt, *args):
+            pass
+    return ApiHandler
+
+def serve_api(host="127.0.0.1", port=8002, store=None, scheduler=None, similar=None):
+    store = store or RunStore()
+    server = ThreadingHTTPServer((host, port), make_handler(store, scheduler, similar))
+    server.daemon_threads = True
+    server.store = store
+    server.scheduler = scheduler
+    server.similar = similar
+    return server
+
+if __name__ == "__main__":
+    from scheduler import Scheduler
+    from similarity_index import SimilarityIndex
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8002
+    server = serve_api(port=port, scheduler=Scheduler().start(), similar=SimilarityIndex())
+    print(f"API at http://{server.server_address[0]}:{server.server_address[1]}/{API_VERSION}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
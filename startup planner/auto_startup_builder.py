@@ -1,6 +1,11 @@
 import sys
 import json
 from concurrent.futures import ThreadPoolExecutor
+from content_pack import section as _pack_section, thaw as _thaw, pack_version
+from localization import get_catalog, msg, html_open
+from profiling import start_profile, agent_call
+from snapshot import start_recording
+from confidence import DEFAULT_ENGINE as _confidence
 from intake_agent import intake_agent as _new_intake_agent
 from research_agent import research_agent as _new_research_agent
 from brand_naming_agent import brand_naming_agent as _new_brand_agent
@@ -84,18 +89,9 @@ def research_agent(brief):
         f"Demand is driven by convenience, automation, and outcome clarity. Buying decisions favor low-friction onboarding, "
         f"transparent pricing, and demonstrable results. Market entry is feasible via niche positioning and content-led acquisition."
     )
-    competitors = [
-        "Competitor A: adjacent solution with broad features; differentiation via focus",
-        "Competitor B: legacy tool; opportunity in modern UX and speed",
-        "Competitor C: niche app; limited scalability; win with integrations",
-        "Competitor D: generic marketplace; lacks personalization; win with data",
-        "Competitor E: manual services; win with automation and pricing"
-    ]
-    opportunities = [
-        "Own a niche persona and speak directly to their workflow",
-        "Automate repetitive steps and show outcomes instantly",
-        "Bundle templates and community signals to increase trust"
-    ]
+    pack = _pack_section("legacy")
+    competitors = list(pack["competitors"])
+    opportunities = list(pack["opportunities"])
     assumptions = [
         "audience pain points align with convenience",
         "competitors have gaps in UX and automation",
@@ -112,86 +108,36 @@ def research_agent(brief):
 
 def name_brand_agent(brief):
     base = brief["idea"]
-    def mk(n):
-        return {
-            "name": n,
-            "rationale": f"Relates to {base} with simple, brandable sound",
-            "score": round(0.6 + (hash(n) % 40)/100, 2)
-        }
-    names = [
-        mk("LaunchLy"), mk("SparkNest"), mk("PrimeLeap"), mk("NovaLane"), mk("FlowForge"),
-        mk("IdeaPilot"), mk("VentureBeam"), mk("QuickFoundry"), mk("OrbitBase"), mk("CraftSprint"),
-        mk("MintPath"), mk("BrightLoom"), mk("PeakTide"), mk("ArrowCart"), mk("BoltBay"),
-        mk("TrailMint"), mk("RiseGrid"), mk("Startloom"), mk("Flecto"), mk("Shiftr")
-    ]
-    taglines = [
-        "Start smarter, launch faster",
-        "From idea to traction in days",
-        "Build momentum with clarity",
-        "Your shortcut to product-market fit",
-        "Plan, build, and go"
-    ]
-    personas = [
-        "Pragmatic builder: clear, direct, outcome-first",
-        "Optimistic mentor: encouraging, concise, credible",
-        "Data-driven operator: precise, helpful, trustworthy"
-    ]
+    pack = _pack_section("legacy")
+    rationale = f"Relates to {base} with simple, brandable sound"
+    names = [{"name": n, "rationale": rationale, "score": sc} for n, sc in zip(pack["brand_names"], pack["brand_scores"])]
+    taglines = list(pack["taglines"])
+    personas = list(pack["personas"])
     return {"names": names, "taglines": taglines, "personas": personas}
 
 def product_pricing_agent(brief, research):
-    variants = [
-        {
-            "name": "MVP",
-            "features": ["core workflow", "basic templates", "email support"],
-            "price": "$19/mo",
-            "cost_assumptions": ["hosting $0.10/user/mo", "support 1h/50 users", "no paid ads"]
-        },
-        {
-            "name": "Plus",
-            "features": ["advanced automation", "integrations", "priority support"],
-            "price": "$49/mo",
-            "cost_assumptions": ["hosting $0.25/user/mo", "support 1h/20 users", "light paid ads"]
-        },
-        {
-            "name": "Premium",
-            "features": ["team seats", "analytics", "concierge onboarding"],
-            "price": "$129/mo",
-            "cost_assumptions": ["hosting $0.50/user/mo", "support 1h/10 users", "partner commissions"]
-        }
-    ]
+    variants = _thaw(_pack_section("legacy")["pricing_variants"])
     mvp_steps = ["define niche persona", "ship core workflow", "collect 10 testimonials"]
     cost_assumptions = ["infra scales with seats", "support hours vary by tier", "ads budget small at start"]
     confidence = 0.76
     return {"variants": variants, "mvp_steps": mvp_steps, "cost_assumptions": cost_assumptions, "confidence": confidence}
 
 def gtm_agent(brief, opportunities, personas):
-    calendar = []
-    for d in range(1, 31):
-        if d == 1:
-            action = "publish positioning and value proposition"
-        elif d == 7:
-            action = "release MVP to early adopters"
-        elif d == 14:
-            action = "share case study and collect quotes"
-        elif d == 21:
-            action = "launch small paid test and iterate"
-        elif d == 30:
-            action = "announce open beta and referral offer"
-        else:
-            action = "daily social and outreach"
-        calendar.append({"day": d, "action": action})
+    pack = _pack_section("legacy")
+    cat = get_catalog(brief.get("language"))
+    calendar = [{"day": d, "action": a} for d, a in enumerate(pack["calendar"], 1)]
     posts = []
-    hashtags = "#startup #mvp #product #growth"
+    hashtags = pack["hashtags"]
     for i in range(10):
         posts.append({
             "platform": "Twitter",
-            "caption": f"Day {i+1}: building for {brief['primary_audience']} with a clear outcome",
+            "caption": msg(cat, "gtm.caption_outcome", day=i+1, audience=brief['primary_audience']),
             "asset_type": "image",
-            "CTA": "Join early access",
+            "CTA": msg(cat, "gtm.cta"),
             "hashtags": hashtags,
             "image_prompt": "Clean minimal graphic showing progress and speed"
         })
-    press_pitch = "New tool helps a focused audience accelerate from idea to outcome using automation and templates. Early adopters report faster validation and clearer positioning. Seeking coverage on practical innovation and creator tools."
+    press_pitch = msg(cat, "gtm.press_pitch")
     confidence = 0.7
     return {"calendar": calendar, "posts": posts, "press_pitch": press_pitch, "confidence": confidence}
 
@@ -201,30 +147,24 @@ def _csv_escape(s):
     return s
 
 def deliverables_agent(brief, research, brand, product, gtm):
-    low_conf = []
-    for k in [("research", research.get("confidence", 1.0)), ("product", product.get("confidence", 1.0)), ("gtm", gtm.get("confidence", 1.0))]:
-        if k[1] < 0.6:
-            low_conf.append(k[0])
+    confs = [("research", research.get("confidence", 1.0)), ("product", product.get("confidence", 1.0)), ("gtm", gtm.get("confidence", 1.0))]
+    low_conf = [a for a, _ in _confidence.low(confs)]
+    cat = get_catalog(brief.get("language"))
+    m = cat["messages"]
     title = brand["names"][0]["name"] if brand.get("names") else "Startup"
     tagline = brand["taglines"][0] if brand.get("taglines") else ""
-    onepager_md = f"# {title}\n\n{tagline}\n\n**Problem**\n\n{brief['idea']}\n\n**Solution**\n\nAutomation, clear outcomes, and templates for {brief['audience']}.\n\n**Market**\n\n{research['market_snapshot']}\n\n**Business Model**\n\nSubscription tiers: {', '.join(v['name'] for v in product['variants'])}.\n\n**Team Ask**\n\nLooking for builders and early partners.\n"
+    tiers = ', '.join(v['name'] for v in product['variants'])
+    onepager_md = f"# {title}\n\n{tagline}\n\n**{m['onepager.problem']}**\n\n{brief['idea']}\n\n**{m['onepager.solution']}**\n\n{msg(cat, 'onepager.solution_text', audience=brief['audience'])}\n\n**{m['onepager.market']}**\n\n{research['market_snapshot']}\n\n**{m['onepager.business_model']}**\n\n{msg(cat, 'onepager.tiers', tiers=tiers)}\n\n**{m['onepager.team_ask']}**\n\n{m['onepager.team_ask_text']}\n"
     if low_conf:
-        onepager_md = "**Confidence warning: " + ", ".join(low_conf) + "**\n\n" + onepager_md
+        onepager_md = "**" + msg(cat, "onepager.confidence_warning", agents=", ".join(low_conf)) + "**\n\n" + onepager_md
     landing_html_text = (
-        f"<section class='hero'><h1>{title}</h1><p>{tagline}</p><button>Get Early Access</button></section>"+
-        f"<section><h2>Features</h2><ul><li>{product['variants'][0]['features'][0]}</li><li>{product['variants'][0]['features'][1]}</li><li>{product['variants'][0]['features'][2]}</li></ul></section>"+
-        f"<section><h2>How it helps</h2><p>Designed for {brief['primary_audience']} to achieve outcomes fast.</p></section>"+
-        f"<section><h2>Pricing</h2><p>{', '.join(v['name']+': '+v['price'] for v in product['variants'])}</p></section>"+
-        f"<meta name='title' content='{title} - {tagline}'><meta name='description' content='Plan, build, and launch faster'>"
+        f"<section class='hero'><h1>{title}</h1><p>{tagline}</p><button>{m['site.cta']}</button></section>"+
+        f"<section><h2>{m['site.features']}</h2><ul><li>{product['variants'][0]['features'][0]}</li><li>{product['variants'][0]['features'][1]}</li><li>{product['variants'][0]['features'][2]}</li></ul></section>"+
+        f"<section><h2>{m['landing.how_it_helps']}</h2><p>{msg(cat, 'landing.helps_text', audience=brief['primary_audience'])}</p></section>"+
+        f"<section><h2>{m['site.pricing']}</h2><p>{', '.join(v['name']+': '+v['price'] for v in product['variants'])}</p></section>"+
+        f"<meta name='title' content='{title} - {tagline}'><meta name='description' content='{m['site.default_description']}'>"
     )
-    pitch_bullets = [
-        "Focuses on a clear niche audience",
-        "Delivers instant value via automation",
-        "Low-friction onboarding with templates",
-        "Subscription model with scalable margins",
-        "Early adopter momentum and content-led growth",
-        "Partner-ready with integrations"
-    ]
+    pitch_bullets = [m[f"pitch.bullet_{i}"] for i in range(1, 7)]
     logo_prompt = [
         f"Minimal geometric mark, modern sans-serif logotype, evokes speed and clarity for {title}",
         f"Friendly rounded mark, subtle gradient, approachable innovation vibe for {title}"
@@ -241,15 +181,7 @@ def deliverables_agent(brief, research, brand, product, gtm):
         ])
         rows.append(row)
     social_csv = "\n".join(rows)
-    next_steps = [
-        "Day 1: finalize positioning and hero messaging",
-        "Day 2: build landing and waitlist",
-        "Day 3: seed 20 prospects",
-        "Day 4: ship MVP core flow",
-        "Day 5: collect feedback and iterate",
-        "Day 6: publish case study",
-        "Day 7: start referral program"
-    ]
+    next_steps = [m[f"next_steps.day_{i}"] for i in range(1, 8)]
     assumptions_summary = {
         "intake": brief.get("assumptions", []),
         "research": research.get("assumptions", []),
@@ -276,21 +208,24 @@ def deliverables_agent(brief, research, brand, product, gtm):
         "next_steps": next_steps,
         "assumptions_summary": assumptions_summary,
         "confidence_summary": confidence_summary,
+        "confidence_score": _confidence.score(confs),
         "plain_files": plain_files
     }
 
 def website_agent(brief, brand, product, deliverables):
+    cat = get_catalog(brief.get("language"))
+    m = cat["messages"]
+    doc = html_open(cat)
     title = brand["names"][0]["name"] if brand.get("names") else "Startup"
-    tagline = brand["taglines"][0] if brand.get("taglines") else "Launch faster"
+    tagline = brand["taglines"][0] if brand.get("taglines") else m["site.default_tagline"]
     features = product["variants"][0]["features"]
     pricing = ", ".join(v['name']+': '+v['price'] for v in product['variants'])
-    index_html = f"""<!doctype html>
-<html lang=\"en\">
+    index_html = f"""{doc}
 <head>
   <meta charset=\"utf-8\">
   <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
   <title>{title} – {tagline}</title>
-  <meta name=\"description\" content=\"Plan, build, and launch faster\">
+  <meta name=\"description\" content=\"{m['site.default_description']}\">
   <link rel=\"stylesheet\" href=\"styles.css\">
   <script type=\"application/ld+json\">{{\"@context\":\"https://schema.org\",\"@type\":\"Organization\",\"name\":\"{title}\"}}</script>
 </head>
@@ -298,49 +233,49 @@ def website_agent(brief, brand, product, deliverables):
   <header class=\"hero\">
     <h1>{title}</h1>
     <p class=\"tagline\">{tagline}</p>
-    <a class=\"cta\" href=\"#pricing\">Get Early Access</a>
+    <a class=\"cta\" href=\"#pricing\">{m['site.cta']}</a>
   </header>
   <main>
-    <section class=\"features\" aria-label=\"Features\">
-      <h2>Features</h2>
+    <section class=\"features\" aria-label=\"{m['site.features']}\">
+      <h2>{m['site.features']}</h2>
       <div class=\"grid\">
         <article>
           <img src=\"assets/feature-1.png\" alt=\"Feature icon\" />
-          <h3>{features[0]}</h3><p>Simple and effective.</p>
+          <h3>{features[0]}</h3><p>{m['site.feature_1_desc']}</p>
         </article>
         <article>
           <img src=\"assets/feature-2.png\" alt=\"Feature icon\" />
-          <h3>{features[1]}</h3><p>Templates to start fast.</p>
+          <h3>{features[1]}</h3><p>{m['site.feature_templates_desc']}</p>
         </article>
         <article>
           <img src=\"assets/feature-3.png\" alt=\"Feature icon\" />
-          <h3>{features[2]}</h3><p>Support when you need it.</p>
+          <h3>{features[2]}</h3><p>{m['site.feature_support_desc']}</p>
         </article>
       </div>
     </section>
-    <section id=\"pricing\" class=\"pricing\" aria-label=\"Pricing\">
-      <h2>Pricing</h2>
+    <section id=\"pricing\" class=\"pricing\" aria-label=\"{m['site.pricing']}\">
+      <h2>{m['site.pricing']}</h2>
       <p>{pricing}</p>
     </section>
-    <section class=\"social-proof\" aria-label=\"Social Proof\">
-      <h2>What early users say</h2>
+    <section class=\"social-proof\" aria-label=\"{m['site.social_proof']}\">
+      <h2>{m['site.testimonials_heading']}</h2>
       <ul>
-        <li><blockquote>Helped me launch faster.</blockquote><cite>— Early Adopter</cite></li>
+        <li><blockquote>{m['site.testimonial']}</blockquote><cite>— {m['site.testimonial_cite']}</cite></li>
       </ul>
     </section>
-    <section class=\"cta-section\" aria-label=\"Join\">
+    <section class=\"cta-section\" aria-label=\"{m['site.join']}\">
       <form class=\"email-capture\" action=\"#\" method=\"post\">
-        <input type=\"email\" placeholder=\"Enter your email\" aria-label=\"Email\" />
-        <button type=\"submit\" class=\"cta\">Join the waitlist</button>
+        <input type=\"email\" placeholder=\"{m['site.email_placeholder']}\" aria-label=\"{m['site.email_label']}\" />
+        <button type=\"submit\" class=\"cta\">{m['site.waitlist']}</button>
       </form>
     </section>
   </main>
   <footer>
     <small>&copy; {title}</small>
-    <nav aria-label=\"Social links\">
+    <nav aria-label=\"{m['site.social_links']}\">
       <a href=\"#\" aria-label=\"Twitter\">Twitter</a>
       <a href=\"#\" aria-label=\"LinkedIn\">LinkedIn</a>
-      <a href=\"#\" aria-label=\"Email\">Email</a>
+      <a href=\"#\" aria-label=\"{m['site.email_label']}\">{m['site.email_label']}</a>
     </nav>
   </footer>
 </body>
@@ -372,9 +307,9 @@ footer nav { display:flex; gap:1rem; justify-content:center; margin-top:.5rem; }
 """
     assets_list = [
         {"file": "assets/hero.jpg", "alt": f"Hero visual for {title}", "prompt": "Abstract geometric speed/clarity motif, soft gradient"},
-        {"file": "assets/feature-1.png", "alt": "Feature icon", "prompt": "Minimal line icon of automation"},
-        {"file": "assets/feature-2.png", "alt": "Feature icon", "prompt": "Minimal line icon of templates"},
-        {"file": "assets/feature-3.png", "alt": "Feature icon", "prompt": "Minimal line icon of support"},
+        {"file": "assets/feature-1.png", "alt": m["site.feature_icon_alt"], "prompt": "Minimal line icon of automation"},
+        {"file": "assets/feature-2.png", "alt": m["site.feature_icon_alt"], "prompt": "Minimal line icon of templates"},
+        {"file": "assets/feature-3.png", "alt": m["site.feature_icon_alt"], "prompt": "Minimal line icon of support"},
         {"file": "assets/social-proof.jpg", "alt": "Testimonials collage", "prompt": "Clean quotes layout, subtle background"}
     ]
     readme_deploy = (
@@ -386,9 +321,9 @@ footer nav { display:flex; gap:1rem; justify-content:center; margin-top:.5rem; }
         "2. Drag-and-drop the 'site' folder into Netlify; publish."
     )
     confidence = 0.8
-    about_html = f"""<!doctype html><html lang=\"en\"><head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>About – {title}</title><link rel=\"stylesheet\" href=\"styles.css\"></head><body><main><h1>About</h1><p>Our mission is to help {brief['primary_audience']} achieve outcomes faster.</p><section><h2>Story</h2><p>Built to simplify and accelerate.</p></section><section><h2>Team</h2><p>Team info coming soon.</p></section></main></body></html>"""
-    pricing_html = f"""<!doctype html><html lang=\"en\"><head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>Pricing – {title}</title><link rel=\"stylesheet\" href=\"styles.css\"></head><body><main><h1>Pricing</h1><ul><li>{product['variants'][0]['name']} – {product['variants'][0]['price']}</li><li>{product['variants'][1]['name']} – {product['variants'][1]['price']}</li><li>{product['variants'][2]['name']} – {product['variants'][2]['price']}</li></ul></main></body></html>"""
-    contact_html = f"""<!doctype html><html lang=\"en\"><head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>Contact – {title}</title><link rel=\"stylesheet\" href=\"styles.css\"></head><body><main><h1>Contact</h1><p>Email us at hello@example.com</p><form action=\"mailto:hello@example.com\" method=\"post\"><input type=\"text\" placeholder=\"Your name\"><input type=\"email\" placeholder=\"Your email\"><textarea placeholder=\"Message\"></textarea><button type=\"submit\">Send</button></form></main></body></html>"""
+    about_html = f"""{doc}<head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>{m['site.about']} – {title}</title><link rel=\"stylesheet\" href=\"styles.css\"></head><body><main><h1>{m['site.about']}</h1><p>{msg(cat, 'site.about_mission_text', audience=brief['primary_audience'])}</p><section><h2>{m['site.story']}</h2><p>{m['site.about_story_text']}</p></section><section><h2>{m['site.team']}</h2><p>{m['site.team_text']}</p></section></main></body></html>"""
+    pricing_html = f"""{doc}<head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>{m['site.pricing']} – {title}</title><link rel=\"stylesheet\" href=\"styles.css\"></head><body><main><h1>{m['site.pricing']}</h1><ul><li>{product['variants'][0]['name']} – {product['variants'][0]['price']}</li><li>{product['variants'][1]['name']} – {product['variants'][1]['price']}</li><li>{product['variants'][2]['name']} – {product['variants'][2]['price']}</li></ul></main></body></html>"""
+    contact_html = f"""{doc}<head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>{m['site.contact']} – {title}</title><link rel=\"stylesheet\" href=\"styles.css\"></head><body><main><h1>{m['site.contact']}</h1><p>{msg(cat, 'site.contact_email', email='hello@example.com')}</p><form action=\"mailto:hello@example.com\" method=\"post\"><input type=\"text\" placeholder=\"{m['site.name_placeholder']}\"><input type=\"email\" placeholder=\"{m['site.your_email_placeholder']}\"><textarea placeholder=\"{m['site.message_placeholder']}\"></textarea><button type=\"submit\">{m['site.send']}</button></form></main></body></html>"""
     return {"index_html": index_html, "about_html": about_html, "pricing_html": pricing_html, "contact_html": contact_html, "styles_css": styles_css, "assets_list": assets_list, "readme_deploy": readme_deploy, "confidence": confidence}
 
 def content_agent(brief):
@@ -433,29 +368,80 @@ def seo_accessibility_agent(brief, content):
     checklist = ["Alt text added", "ARIA labels on sections", "High contrast colors"]
     return {"meta": meta, "accessibility_checklist": checklist, "confidence": 0.78}
 
-def run_pipeline(idea_text, language="English", tone_override=None):
-    intake = fusion_intake_agent(idea_text, language, tone_override)
-    def run_research():
-        return fusion_research_agent(intake)
-    def run_brand():
-        return fusion_brand_agent(intake, None)
-    def run_product():
-        return fusion_product_agent(intake, None)
-    with ThreadPoolExecutor(max_workers=3) as ex:
-        futs = [ex.submit(run_research), ex.submit(run_brand), ex.submit(run_product)]
-        research, brand, product = [f.result() for f in futs]
-    gtm = fusion_gtm_agent(intake, research, brand, product)
-    website = fusion_website_agent(brand, product, gtm, intake)
-    deliverables = fusion_deliverables_agent(intake, research, brand, product, gtm, website)
-    return {
-        "intake": intake,
-        "research": research,
-        "brand": brand,
-        "product": product,
-        "gtm": gtm,
-        "website": website,
-        "deliverables": deliverables
-    }
+def _reuse_scope(intake):
+    # everything besides the idea text that the fusion agents read
+    return (intake["target_audience"], intake["language"], intake["tone"], pack_version())
+
+def _adapt_reused(result, intake):
+    # re-renders only the fields built from the idea text; everything else (pack content, pricing) is kept as stored
+    old = result["intake"]
+    cat = get_catalog(intake.get("language"))
+    website, deliverables = result["website"], result["deliverables"]
+    old_meta, new_meta = _fusion_meta(cat, old), _fusion_meta(cat, intake)
+    if website["index_html"].count(old_meta) != 1:
+        return None
+    result["intake"] = json.loads(json.dumps(intake))
+    result["research"]["market_snapshot"] = _fusion_market_snapshot(intake["idea"], intake["target_audience"])
+    for n in result["brand"]["names"]:
+        n["rationale"] = _fusion_rationale(intake["idea"])
+    for i, p in enumerate(result["gtm"]["social_posts"]):
+        p["caption"] = msg(cat, "gtm.caption", day=i+1, audience=intake["target_audience"], idea=intake["idea"])
+    website["index_html"] = website["index_html"].replace(old_meta, new_meta)
+    files = deliverables["files"]
+    files["index.html"] = website["index_html"]
+    files["social_posts.csv"] = _fusion_social_csv(result["gtm"]["social_posts"])
+    files["onepager.md"] = _fusion_onepager(cat["messages"], result["intake"], result["research"], result["brand"], result["product"])
+    return result
+
+def run_pipeline(idea_text, language="English", tone_override=None, profile=None, profile_dir=None, similar=None, record=None, record_dir=None):
+    prof = start_profile(profile, "run_pipeline", profile_dir)
+    rec = start_recording(record, "run_pipeline", "auto_startup_builder:run_pipeline", {"idea_text": idea_text, "language": language, "tone_override": tone_override}, record_dir, prof)
+    hook = rec or prof
+    try:
+        intake = agent_call(hook, "intake", fusion_intake_agent, idea_text, language, tone_override)
+        if similar is not None:
+            reused = similar.reuse(intake["idea"], _reuse_scope(intake), adapt=lambda r: _adapt_reused(r, intake))
+            if reused is not None:
+                if rec is not None:
+                    reused["snapshot"] = rec.finish(reused)
+                if prof is not None:
+                    reused["profile"] = prof.finish()
+                return reused
+        def run_research():
+            return agent_call(hook, "research", fusion_research_agent, intake)
+        def run_brand():
+            return agent_call(hook, "brand", fusion_brand_agent, intake, None)
+        def run_product():
+            return agent_call(hook, "product", fusion_product_agent, intake, None)
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            futs = [ex.submit(run_research), ex.submit(run_brand), ex.submit(run_product)]
+            research, brand, product = [f.result() for f in futs]
+        gtm = agent_call(hook, "gtm", fusion_gtm_agent, intake, research, brand, product)
+        website = agent_call(hook, "website", fusion_website_agent, brand, product, gtm, intake)
+        deliverables = agent_call(hook, "deliverables", fusion_deliverables_agent, intake, research, brand, product, gtm, website)
+        result = {
+            "intake": intake,
+            "research": research,
+            "brand": brand,
+            "product": product,
+            "gtm": gtm,
+            "website": website,
+            "deliverables": deliverables
+        }
+        if similar is not None:
+            similar.add(intake["idea"], _reuse_scope(intake), result)
+        if rec is not None:
+            result["snapshot"] = rec.finish(result)
+        if prof is not None:
+            result["profile"] = prof.finish()
+        return result
+    except Exception as e:
+        if rec is not None:
+            rec.finish(None, error=e)
+        raise
+    finally:
+        if prof is not None:
+            prof.close()
 
 def main():
     if len(sys.argv) < 2:
@@ -466,7 +452,14 @@ def main():
     site_dir = None
     export_dir = None
     approve = False
-    # args: IDEA [--out path] [--site-dir dir] [--export-dir dir] [--approve]
+    optimize = False
+    preview_port = None
+    profile = None
+    profile_dir = None
+    archive_dir = None
+    record = None
+    record_dir = None
+    # args: IDEA [--out path] [--site-dir dir] [--export-dir dir] [--approve] [--optimize] [--preview [port]] [--profile [dir]] [--archive dir] [--record [dir]]
     i = 2
     while i < len(sys.argv):
         if sys.argv[i] == "--out" and i+1 < len(sys.argv):
@@ -481,6 +474,33 @@ def main():
         elif sys.argv[i] == "--approve":
             approve = True
             i += 1
+        elif sys.argv[i] == "--optimize":
+            optimize = True
+            i += 1
+        elif sys.argv[i] == "--preview":
+            if i+1 < len(sys.argv) and sys.argv[i+1].isdigit():
+                preview_port = int(sys.argv[i+1])
+                i += 2
+            else:
+                preview_port = 8001
+                i += 1
+        elif sys.argv[i] == "--archive" and i+1 < len(sys.argv):
+            archive_dir = sys.argv[i+1]
+            i += 2
+        elif sys.argv[i] == "--profile":
+            profile = True
+            if i+1 < len(sys.argv) and not sys.argv[i+1].startswith("--"):
+                profile_dir = sys.argv[i+1]
+                i += 2
+            else:
+                i += 1
+        elif sys.argv[i] == "--record":
+            record = True
+            if i+1 < len(sys.argv) and not sys.argv[i+1].startswith("--"):
+                record_dir = sys.argv[i+1]
+                i += 2
+            else:
+                i += 1
         elif sys.argv[i] == "--language" and i+1 < len(sys.argv):
             language = sys.argv[i+1]
             i += 2
@@ -491,14 +511,30 @@ def main():
             i += 1
     language = locals().get("language","English")
     tone = locals().get("tone", None)
-    result = run_pipeline(idea_text, language, tone)
+    result = run_pipeline(idea_text, language, tone, profile, profile_dir, record=record, record_dir=record_dir)
+    if "profile" in result:
+        print(f"Profile written to {result['profile']['dir']}", file=sys.stderr)
+    if "snapshot" in result:
+        print(f"Snapshot written to {result['snapshot']['path']}", file=sys.stderr)
     if out_path:
         with open(out_path, "w", encoding="utf-8") as f:
             json.dump(result, f, indent=2)
         print(out_path)
     else:
         print(json.dumps(result, indent=2))
-    if site_dir:
+    if archive_dir:
+        from run_archive import ArchiveWriter
+        with ArchiveWriter(archive_dir) as w:
+            w.append(result)
+    if site_dir and optimize:
+        from site_optimizer import optimize_site, write_site, SITE_FILES
+        files = result["deliverables"]["files"]
+        write_site(optimize_site({n: files[n] for n in SITE_FILES}), site_dir)
+        import os
+        os.makedirs(os.path.join(site_dir, "assets"), exist_ok=True)
+        with open(os.path.join(site_dir, "assets", "PLACEHOLDERS.txt"), "w", encoding="utf-8") as f:
+            f.write(files.get("assets_prompts.txt",""))
+    elif site_dir:
         import os
         os.makedirs(site_dir, exist_ok=True)
         os.makedirs(os.path.join(site_dir, "assets"), exist_ok=True)
@@ -533,17 +569,36 @@ def main():
         os.makedirs(site_path, exist_ok=True)
         os.makedirs(os.path.join(site_path, "assets"), exist_ok=True)
         # write website files into site folder from files dict
-        for name in ["index.html","about.html","pricing.html","contact.html","styles.css","README_deploy.txt"]:
-            with open(os.path.join(site_path, name), "w", encoding="utf-8") as f:
-                f.write(files[name])
+        zip_structure = files.get("zip_structure.txt","")
+        if optimize:
+            from site_optimizer import optimize_site, write_site, site_listing, SITE_FILES
+            optimized = optimize_site({n: files[n] for n in SITE_FILES})
+            write_site(optimized, site_path)
+            # the hashed stylesheet replaces styles.css, so list what was actually written
+            zip_structure = site_listing(optimized)
+        else:
+            for name in ["index.html","about.html","pricing.html","contact.html","styles.css","README_deploy.txt"]:
+                with open(os.path.join(site_path, name), "w", encoding="utf-8") as f:
+                    f.write(files[name])
         with open(os.path.join(site_path, "assets", "PLACEHOLDERS.txt"), "w", encoding="utf-8") as f:
             f.write(files.get("assets_prompts.txt",""))
         with open(os.path.join(export_dir, "zip_structure.txt"), "w", encoding="utf-8") as f:
-            f.write(files.get("zip_structure.txt",""))
+            f.write(zip_structure)
         print(export_dir)
-
-if __name__ == "__main__":
-    main()
+    if preview_port is not None:
+        from preview_server import serve_preview
+        files = result["deliverables"]["files"]
+        if optimize:
+            from site_optimizer import optimize_site, SITE_FILES
+            files = dict(files, **optimize_site({n: files[n] for n in SITE_FILES}))
+        server = serve_preview(files, port=preview_port)
+        print(f"Preview at http://{server.server_address[0]}:{server.server_address[1]}/", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
 def fusion_intake_agent(raw_idea, language="EN", tone=None):
     idea = raw_idea.strip()
     audience = _infer_audience(idea)
@@ -563,29 +618,42 @@ def fusion_intake_agent(raw_idea, language="EN", tone=None):
         **({"follow_up_question": follow_up} if follow_up else {})
     }
 
+def _fusion_market_snapshot(idea, audience):
+    return f"For {audience}, the concept '{idea}' benefits from convenience and clarity. Buying decisions hinge on price, trust, and availability. Opportunity exists in niche positioning and direct outreach."
+
+def _fusion_rationale(idea):
+    return f"Relates to {idea}"
+
+def _fusion_meta(cat, intake):
+    return f"<meta name='description' content='{msg(cat, 'site.meta_description', idea=intake['idea'], audience=intake['target_audience'])}'>"
+
+def _fusion_social_csv(posts):
+    return "\n".join(["platform,caption,image_prompt,hashtags"] + [",".join([
+        p["platform"],
+        p["caption"].replace(","," "),
+        p["image_prompt"].replace(","," "),
+        p["hashtags"].replace(","," ")
+    ]) for p in posts])
+
+def _fusion_onepager(m, intake, research, brand, product):
+    return f"# {brand['names'][0]['name']}\n\n{brand['taglines'][0]}\n\n**{m['onepager.idea']}**\n\n{intake['idea']}\n\n**{m['onepager.audience']}**\n\n{intake['target_audience']}\n\n**{m['onepager.market']}**\n\n{research['market_snapshot']}\n\n**{m['onepager.product']}**\n\n"+"; ".join(v['name'] for v in product['variants'])+"\n"
+
 def fusion_research_agent(intake):
     idea = intake["idea"]
     audience = intake["target_audience"]
-    market_snapshot = f"For {audience}, the concept '{idea}' benefits from convenience and clarity. Buying decisions hinge on price, trust, and availability. Opportunity exists in niche positioning and direct outreach."
-    competitors = [
-        {"name":"Local incumbent","note":"Trust and availability; improve with UX and clarity"},
-        {"name":"Online marketplace","note":"Wide selection; compete via curated experience"},
-        {"name":"Subscription provider","note":"Recurring model; win with flexibility and pricing"}
-    ]
-    opportunities = [
-        "Own a specific niche persona and message directly",
-        "Automate ordering and updates",
-        "Bundle with simple perks to raise retention"
-    ]
+    pack = _pack_section("fusion")
+    market_snapshot = _fusion_market_snapshot(idea, audience)
+    competitors = _thaw(pack["competitors"])
+    opportunities = list(pack["opportunities"])
     assumptions = ["pricing sensitivity moderate", "organic content viable", "logistics manageable at small scale"]
     return {"market_snapshot": market_snapshot, "competitors": competitors, "opportunities": opportunities, "assumptions": assumptions, "confidence": 0.72}
 
 def fusion_brand_agent(intake, research):
     base = intake["idea"]
-    def mk(n,i):
-        return {"name": n, "rationale": f"Relates to {base}", "score": round(0.6 + (i%35)/100,2)}
-    names = [mk(n,i) for i,n in enumerate(["MilkMate","FreshFlow","DairyDash","PurePour","CampusMilk","SwiftDairy","MorningPour","CreamLine","Milkloop","Udderly","WhiteWave","DailyDairy","FarmFresh","Milkly","PourJoy"])]
-    taglines = ["Fresh to your door", "Simple, pure, daily", "Subscription freshness", "Better mornings, better milk", "Campus-ready dairy"]
+    pack = _pack_section("fusion")
+    rationale = _fusion_rationale(base)
+    names = [{"name": n, "rationale": rationale, "score": sc} for n, sc in zip(pack["brand_names"], pack["brand_scores"])]
+    taglines = list(pack["taglines"])
     colors = {"primary":"#2563EB","secondary":"#111827","accent":"#F59E0B"}
     font_stack = "system-ui, -apple-system, Segoe UI, Roboto, Arial"
     logo_prompts = [
@@ -596,31 +664,21 @@ def fusion_brand_agent(intake, research):
     return {"names": names, "taglines": taglines, "colors": colors, "font_stack": font_stack, "logo_prompts": logo_prompts, "assumptions": assumptions, "confidence": 0.78}
 
 def fusion_product_agent(intake, research):
-    variants = [
-        {"name":"MVP","features":["daily/alternate-day delivery","basic account","email support"],"price_suggested":"$19/mo"},
-        {"name":"Plus","features":["custom schedule","mobile updates","priority support"],"price_suggested":"$49/mo"},
-        {"name":"Premium","features":["bulk campus plans","analytics","concierge"],"price_suggested":"$129/mo"}
-    ]
+    variants = _thaw(_pack_section("fusion")["pricing_variants"])
     mvp_steps = ["define niche (e.g., dorms)", "set ordering workflow", "collect first 20 subscribers"]
     assumptions = ["costs scale with delivery volume", "support hours per user low", "ads light initially"]
     return {"variants": variants, "mvp_steps": mvp_steps, "assumptions": assumptions, "confidence": 0.76}
 
 def fusion_gtm_agent(intake, research, brand, product):
-    launch = []
-    for d in range(1,31):
-        if d==1: action="announce offer and value"
-        elif d==7: action="pilot deliveries to early adopters"
-        elif d==14: action="share testimonials and adjust"
-        elif d==21: action="run small paid test"
-        elif d==30: action="open broader signups"
-        else: action="daily social and outreach"
-        launch.append({"day": d, "action": action})
+    pack = _pack_section("fusion")
+    launch = [{"day": d, "action": a} for d, a in enumerate(pack["calendar"], 1)]
+    cat = get_catalog(intake.get("language"))
     posts = []
-    tags = "#fresh #local #subscription #students"
+    tags = pack["hashtags"]
     for i in range(10):
         posts.append({
             "platform":"Twitter",
-            "caption": f"Day {i+1}: serving {intake['target_audience']} — {intake['idea']}",
+            "caption": msg(cat, "gtm.caption", day=i+1, audience=intake['target_audience'], idea=intake['idea']),
             "image_prompt":"Clean minimal graphic (milk/campus)",
             "hashtags": tags
         })
@@ -633,13 +691,16 @@ def fusion_website_agent(brand, product, gtm, intake):
     tagline = brand["taglines"][0]
     colors = brand["colors"]
     font = brand["font_stack"]
+    cat = get_catalog(intake.get("language"))
+    m = cat["messages"]
+    doc = html_open(cat)
     def page_head(tt,desc):
         return f"<meta charset='utf-8'><meta name='viewport' content='width=device-width, initial-scale=1'><title>{tt}</title><meta name='description' content='{desc}'><link rel='stylesheet' href='styles.css'>"
-    index_head = page_head(f"{title} – {tagline}", f"{intake['idea']} for {intake['target_audience']}") + f"<script type='application/ld+json'>{{\"@context\":\"https://schema.org\",\"@type\":\"Organization\",\"name\":\"{title}\"}}</script>"
-    index_html = f"""<!doctype html><html lang='en'><head>{index_head}</head><body><header class='hero'><h1>{title}</h1><p class='tagline'>{tagline}</p><a class='cta' href='#pricing'>Get Early Access</a></header><main><section class='features' aria-label='Features'><h2>Features</h2><div class='grid'><article><img src='assets/feature-1.png' alt='Feature icon'><h3>{product['variants'][0]['features'][0]}</h3><p>Simple and effective.</p></article><article><img src='assets/feature-2.png' alt='Feature icon'><h3>{product['variants'][1]['features'][0]}</h3><p>Flexible and clear.</p></article><article><img src='assets/feature-3.png' alt='Feature icon'><h3>{product['variants'][2]['features'][0]}</h3><p>Scale when ready.</p></article></div></section><section id='pricing' class='pricing' aria-label='Pricing'><h2>Pricing</h2><ul><li>{product['variants'][0]['name']} – {product['variants'][0]['price_suggested']}</li><li>{product['variants'][1]['name']} – {product['variants'][1]['price_suggested']}</li><li>{product['variants'][2]['name']} – {product['variants'][2]['price_suggested']}</li></ul></section><section class='cta-section' aria-label='Join'><form class='email-capture' action='#' method='post'><input type='email' placeholder='Enter your email' aria-label='Email'><button type='submit' class='cta'>Join the waitlist</button></form></section></main><footer><small>&copy; {title}</small></footer></body></html>"""
-    about_html = f"<!doctype html><html lang='en'><head>{page_head('About – '+title,'About '+title)}</head><body><main><h1>About</h1><section><h2>Mission</h2><p>Serve {intake['target_audience']} with fresh convenience.</p></section><section><h2>Story</h2><p>Born from the need for reliable, student-friendly subscriptions.</p></section></main></body></html>"
-    pricing_html = f"<!doctype html><html lang='en'><head>{page_head('Pricing – '+title,'Pricing')}</head><body><main><h1>Pricing</h1><ul><li>{product['variants'][0]['name']} – {product['variants'][0]['price_suggested']}</li><li>{product['variants'][1]['name']} – {product['variants'][1]['price_suggested']}</li><li>{product['variants'][2]['name']} – {product['variants'][2]['price_suggested']}</li></ul></main></body></html>"
-    contact_html = f"<!doctype html><html lang='en'><head>{page_head('Contact – '+title,'Contact')}</head><body><main><h1>Contact</h1><p>Email us at hello@example.com</p><form action='mailto:hello@example.com' method='post'><input type='text' placeholder='Your name'><input type='email' placeholder='Your email'><textarea placeholder='Message'></textarea><button type='submit'>Send</button></form></main></body></html>"
+    index_head = f"<meta charset='utf-8'><meta name='viewport' content='width=device-width, initial-scale=1'><title>{title} – {tagline}</title>{_fusion_meta(cat, intake)}<link rel='stylesheet' href='styles.css'>" + f"<script type='application/ld+json'>{{\"@context\":\"https://schema.org\",\"@type\":\"Organization\",\"name\":\"{title}\",\"inLanguage\":\"{cat['lang']}\"}}</script>"
+    index_html = f"""{doc}<head>{index_head}</head><body><header class='hero'><h1>{title}</h1><p class='tagline'>{tagline}</p><a class='cta' href='#pricing'>{m['site.cta']}</a></header><main><section class='features' aria-label='{m['site.features']}'><h2>{m['site.features']}</h2><div class='grid'><article><img src='assets/feature-1.png' alt='{m['site.feature_icon_alt']}'><h3>{product['variants'][0]['features'][0]}</h3><p>{m['site.feature_1_desc']}</p></article><article><img src='assets/feature-2.png' alt='{m['site.feature_icon_alt']}'><h3>{product['variants'][1]['features'][0]}</h3><p>{m['site.feature_2_desc']}</p></article><article><img src='assets/feature-3.png' alt='{m['site.feature_icon_alt']}'><h3>{product['variants'][2]['features'][0]}</h3><p>{m['site.feature_3_desc']}</p></article></div></section><section id='pricing' class='pricing' aria-label='{m['site.pricing']}'><h2>{m['site.pricing']}</h2><ul><li>{product['variants'][0]['name']} – {product['variants'][0]['price_suggested']}</li><li>{product['variants'][1]['name']} – {product['variants'][1]['price_suggested']}</li><li>{product['variants'][2]['name']} – {product['variants'][2]['price_suggested']}</li></ul></section><section class='cta-section' aria-label='{m['site.join']}'><form class='email-capture' action='#' method='post'><input type='email' placeholder='{m['site.email_placeholder']}' aria-label='{m['site.email_label']}'><button type='submit' class='cta'>{m['site.waitlist']}</button></form></section></main><footer><small>&copy; {title}</small></footer></body></html>"""
+    about_html = f"{doc}<head>{page_head(m['site.about']+' – '+title, msg(cat, 'site.about_title', title=title))}</head><body><main><h1>{m['site.about']}</h1><section><h2>{m['site.mission']}</h2><p>{msg(cat, 'site.mission_text', audience=intake['target_audience'])}</p></section><section><h2>{m['site.story']}</h2><p>{m['site.story_text']}</p></section></main></body></html>"
+    pricing_html = f"{doc}<head>{page_head(m['site.pricing']+' – '+title, m['site.pricing'])}</head><body><main><h1>{m['site.pricing']}</h1><ul><li>{product['variants'][0]['name']} – {product['variants'][0]['price_suggested']}</li><li>{product['variants'][1]['name']} – {product['variants'][1]['price_suggested']}</li><li>{product['variants'][2]['name']} – {product['variants'][2]['price_suggested']}</li></ul></main></body></html>"
+    contact_html = f"{doc}<head>{page_head(m['site.contact']+' – '+title, m['site.contact'])}</head><body><main><h1>{m['site.contact']}</h1><p>{msg(cat, 'site.contact_email', email='hello@example.com')}</p><form action='mailto:hello@example.com' method='post'><input type='text' placeholder='{m['site.name_placeholder']}'><input type='email' placeholder='{m['site.your_email_placeholder']}'><textarea placeholder='{m['site.message_placeholder']}'></textarea><button type='submit'>{m['site.send']}</button></form></main></body></html>"
     styles_css = f":root {{ --bg:{colors['secondary']}; --fg:#e8eaed; --muted:#9aa0a6; --brand:{colors['primary']}; --accent:{colors['accent']}; }}\n* {{ box-sizing: border-box; }}\nbody {{ margin:0; font-family: {font}; color: var(--fg); background: var(--bg); }}\n.hero {{ padding: 4rem 1rem; text-align:center; background: linear-gradient(135deg, var(--secondary,#0b0d12) 0%, #14213d 100%); }}\n.hero h1 {{ margin:0 0 .5rem; font-size: clamp(2rem, 5vw, 3rem); }}\n.tagline {{ color: var(--muted); margin-bottom:1rem; }}\n.cta {{ display:inline-block; padding:.75rem 1rem; background: var(--brand); color:#fff; text-decoration:none; border-radius:.5rem; }}\nmain {{ max-width: 960px; margin: 0 auto; padding: 2rem 1rem; }}\n.features .grid {{ display: grid; gap: 1rem; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); }}\n.features article {{ padding:1rem; border: 1px solid #1f2937; border-radius:.75rem; background:#111827; }}\n.features img {{ width:48px; height:48px; display:block; margin-bottom:.5rem; opacity:.8; }}\n.features h3 {{ margin:.25rem 0 .5rem; font-size:1.1rem; }}\n.pricing, .cta-section {{ margin-top:2rem; }}\n.email-capture {{ display:flex; gap:.5rem; justify-content:center; }}\n.email-capture input {{ padding:.5rem; border-radius:.5rem; border:1px solid #1f2937; background:#0f172a; color:var(--fg); width:min(100%,280px); }}\n.email-capture button {{ padding:.5rem 1rem; }}\nfooter {{ text-align:center; padding:2rem 1rem; color: var(--muted); }}\n@media (prefers-color-scheme: light) {{ :root {{ --bg:#ffffff; --fg:#111827; --muted:#6b7280; --brand:{colors['primary']}; }} .features article {{ background:#f9fafb; border-color:#e5e7eb; }} }}"
     assets_list = [
         {"filename":"assets/hero.jpg","alt_text":f"Hero visual for {title}","prompt":"Droplet/cream motif","size":"1200x800"},
@@ -651,10 +712,9 @@ def fusion_website_agent(brand, product, gtm, intake):
     return {"index_html": index_html, "about_html": about_html, "pricing_html": pricing_html, "contact_html": contact_html, "styles_css": styles_css, "assets_list": assets_list, "assumptions": assumptions, "confidence": 0.8}
 
 def fusion_deliverables_agent(intake, research, brand, product, gtm, website):
-    needs = []
-    for name,val in [("research",research["confidence"]),("brand",brand["confidence"]),("product",product["confidence"]),("gtm",gtm["confidence"]),("website",website["confidence"])]:
-        if val < 0.6:
-            needs.append(name)
+    confs = [("research",research["confidence"]),("brand",brand["confidence"]),("product",product["confidence"]),("gtm",gtm["confidence"]),("website",website["confidence"])]
+    needs = [a for a, _ in _confidence.low(confs)]
+    m = get_catalog(intake.get("language"))["messages"]
     files = {
         "index.html": website["index_html"],
         "about.html": website["about_html"],
@@ -662,16 +722,9 @@ def fusion_deliverables_agent(intake, research, brand, product, gtm, website):
         "contact.html": website["contact_html"],
         "styles.css": website["styles_css"],
         "assets_prompts.txt": "\n".join(f"{a['filename']} | alt={a['alt_text']} | prompt={a['prompt']} | size={a['size']}" for a in website["assets_list"]),
-        "social_posts.csv": "\n".join([
-            "platform,caption,image_prompt,hashtags" 
-        ] + [ ",".join([
-            p["platform"],
-            p["caption"].replace(","," "),
-            p["image_prompt"].replace(","," "),
-            p["hashtags"].replace(","," ")
-        ]) for p in gtm["social_posts"] ]),
+        "social_posts.csv": _fusion_social_csv(gtm["social_posts"]),
         "logo_prompts.txt": "\n".join(brand["logo_prompts"]),
-        "onepager.md": f"# {brand['names'][0]['name']}\n\n{brand['taglines'][0]}\n\n**Idea**\n\n{intake['idea']}\n\n**Audience**\n\n{intake['target_audience']}\n\n**Market**\n\n{research['market_snapshot']}\n\n**Product**\n\n"+"; ".join(v['name'] for v in product['variants'])+"\n",
+        "onepager.md": _fusion_onepager(m, intake, research, brand, product),
         "README_deploy.txt": "GitHub Pages:\n1. Create a new GitHub repo, upload index.html, styles.css and other files to root.\n2. In repo Settings → Pages → Select main branch → Save → Visit https://<username>.github.io/<repo>.\n\nNetlify:\n1. Create a new site on Netlify.\n2. Drag-and-drop the 'site' folder into Netlify; publish.",
         "zip_structure.txt": "\n".join(["site/index.html","site/about.html","site/pricing.html","site/contact.html","site/styles.css","site/assets/","site/README_deploy.txt"])
     }
@@ -688,7 +741,8 @@ def fusion_deliverables_agent(intake, research, brand, product, gtm, website):
             "product": product["confidence"],
             "gtm": gtm["confidence"],
             "website": website["confidence"]
-        }
+        },
+        "score": _confidence.score(confs)
     }
     return {"files": files, "assumptions_and_confidence": assumptions_and_confidence, "needs_review_flags": needs, "export_ready": True}
 FALLBACK = "NOTHING WORKING — NO OUTPUTS"
@@ -718,9 +772,10 @@ def req_research_agent(intake):
             raise ValueError("no idea")
         audience = intake.get("target_audience", FALLBACK)
         idea = intake.get("idea", FALLBACK)
+        pack = _pack_section("req")
         market_snapshot = f"For {audience}, the idea '{idea}' is driven by convenience, price, and trust. Entry via clear positioning and direct outreach." if audience != FALLBACK else FALLBACK
-        top_competitors = [{"name":"Local providers","why_relevant":"Trust and availability"},{"name":"Marketplaces","why_relevant":"Broad choice"}] if audience != FALLBACK else FALLBACK
-        key_opportunities = ["Own a niche persona","Automate ordering","Bundle perks for retention"] if audience != FALLBACK else FALLBACK
+        top_competitors = _thaw(pack["competitors"]) if audience != FALLBACK else FALLBACK
+        key_opportunities = list(pack["opportunities"]) if audience != FALLBACK else FALLBACK
         assumptions = ["pricing sensitivity moderate","organic content viable","logistics manageable"]
         confidence = 0.72
         return {
@@ -738,11 +793,10 @@ def req_brand_agent(intake, research):
         base = intake.get("idea", FALLBACK)
         if base == FALLBACK:
             raise ValueError("no idea")
-        def mk(n,i):
-            return {"name": n, "rationale": f"Relates to {base}", "score": round(0.6 + (i%35)/100,2)}
-        names_raw = ["BrightCart","FlowMilk","PurePath","FreshStep","MorningMaze","SwiftPour","CampusFresh","DailyDash","CreamLine","WhiteWave"]
-        names = [mk(n,i) for i,n in enumerate(names_raw)]
-        taglines = ["Fresh made simple","Ready for every day","Quality you can count","Subscription freshness","Better mornings"]
+        pack = _pack_section("req")
+        rationale = f"Relates to {base}"
+        names = [{"name": n, "rationale": rationale, "score": sc} for n, sc in zip(pack["brand_names"], pack["brand_scores"])]
+        taglines = list(pack["taglines"])
         chosen_name = names[0]["name"]
         color_palette = {"primary":"#2563EB","secondary":"#111827","accent":"#F59E0B"}
         font_stack = "system-ui, -apple-system, Segoe UI, Roboto, Arial"
@@ -754,49 +808,34 @@ def req_brand_agent(intake, research):
 
 def req_product_pricing_agent(intake, research, brand):
     try:
-        variants = [
-            {"variant_name":"MVP","size_options":"S/M/L","features":["basic subscription","weekly delivery","email support"]},
-            {"variant_name":"Plus","size_options":"S/M/L","features":["custom schedule","mobile updates","priority support"]},
-            {"variant_name":"Premium","size_options":"S/M/L","features":["bulk plans","analytics","concierge"]}
-        ]
-        pricing = [
-            {"variant_name":"MVP","price_currency":"USD","suggested_price":"19","price_rationale":"entry tier for validation"},
-            {"variant_name":"Plus","price_currency":"USD","suggested_price":"49","price_rationale":"features for flexibility"},
-            {"variant_name":"Premium","price_currency":"USD","suggested_price":"129","price_rationale":"team/campus scaling"}
-        ]
+        tiers = _pack_section("req")["pricing_variants"]
+        variants = [{"variant_name": t["variant_name"], "size_options": t["size_options"], "features": list(t["features"])} for t in tiers]
+        pricing = [{"variant_name": t["variant_name"], "price_currency": t["price_currency"], "suggested_price": t["suggested_price"], "price_rationale": t["price_rationale"]} for t in tiers]
         cost_assumptions = ["infra scales with seats","support hours vary by tier","ads budget small at start"]
-        mvp_pricing_recommendation = "Start with MVP at $19/mo, test conversion, then upsell to Plus."
+        mvp_pricing_recommendation = msg(get_catalog(intake.get("language")), "product.mvp_recommendation")
         return {"sizes_and_variants": variants, "pricing": pricing, "cost_assumptions": cost_assumptions, "mvp_pricing_recommendation": mvp_pricing_recommendation, "confidence": 0.76}
     except Exception:
         return {"sizes_and_variants": FALLBACK, "pricing": FALLBACK, "cost_assumptions": FALLBACK, "mvp_pricing_recommendation": FALLBACK, "confidence": 0.4}
 
 def req_gtm_agent(intake, research, brand, product):
     try:
-        plan = []
-        for d in range(1,31):
-            if d==1: action="announce offer and value"
-            elif d==7: action="pilot to early adopters"
-            elif d==14: action="share testimonials"
-            elif d==21: action="run small paid test"
-            elif d==30: action="open broader signups"
-            else: action="daily social and outreach"
-            plan.append({"day": d, "action": action})
+        plan = [{"day": d, "action": a} for d, a in enumerate(_pack_section("req")["calendar"], 1)]
+        cat = get_catalog(intake.get("language"))
+        m = cat["messages"]
         priority_channels = [
-            {"channel":"Instagram","reason":"visual appeal","score":0.7},
-            {"channel":"TikTok","reason":"campus reach","score":0.75},
-            {"channel":"Campus flyers","reason":"local trust","score":0.6}
+            {"channel":"Instagram","reason":m["gtm.reason_visual"],"score":0.7},
+            {"channel":"TikTok","reason":m["gtm.reason_campus"],"score":0.75},
+            {"channel":"Campus flyers","reason":m["gtm.reason_local"],"score":0.6}
         ]
-        social_posts_brief = [{"day":i+1,"platform":"Twitter","caption_brief":f"Day {i+1}: building for {intake.get('target_audience','users')}"} for i in range(10)]
-        press_pitch_3_sentences = "Local, fresh subscription tailored to a clear audience. Early adopters report convenience and trust. Seeking coverage on practical micro-subscriptions and campus services."
+        social_posts_brief = [{"day":i+1,"platform":"Twitter","caption_brief":msg(cat, "gtm.caption_brief", day=i+1, audience=intake.get('target_audience','users'))} for i in range(10)]
+        press_pitch_3_sentences = m["gtm.press_pitch_local"]
         return {"launch_30_day_plan": plan, "priority_channels": priority_channels, "social_posts_brief": social_posts_brief, "press_pitch_3_sentences": press_pitch_3_sentences, "confidence": 0.7}
     except Exception:
         return {"launch_30_day_plan": FALLBACK, "priority_channels": FALLBACK, "social_posts_brief": FALLBACK, "press_pitch_3_sentences": FALLBACK, "confidence": 0.4}
 
 def req_deliverables_agent(intake, research, brand, product, gtm):
-    needs = []
-    for aid, conf in [("research", research.get("confidence",0)), ("brand", brand.get("confidence",0)), ("product", product.get("confidence",0)), ("gtm", gtm.get("confidence",0))]:
-        if conf < 0.6:
-            needs.append({"agent_id": aid, "reason": "confidence below threshold", "confidence": conf})
+    confs = [("research", research.get("confidence",0)), ("brand", brand.get("confidence",0)), ("product", product.get("confidence",0)), ("gtm", gtm.get("confidence",0))]
+    needs = _confidence.flags(confs)
     deliverables = {
         "market_research": research if research else FALLBACK,
         "brand_and_naming": brand if brand else FALLBACK,
@@ -810,6 +849,7 @@ def req_deliverables_agent(intake, research, brand, product, gtm):
             "gtm": ["channels chosen for audience", "organic content viable"]
         },
         "needs_review_flags": needs,
+        "confidence_score": _confidence.score(confs),
         "export_ready": True
     }
     def _is_fallback(agent_id, agent):
@@ -824,26 +864,21 @@ def req_deliverables_agent(intake, research, brand, product, gtm):
             if isinstance(v, str) and v == FALLBACK:
                 return True
         return False
-    def _recovery_options(agent_id, intake_obj):
-        intake_json = json.dumps(intake_obj, ensure_ascii=False)
+    intake_json = None
+    m = get_catalog(intake.get("language"))["messages"]
+    def _recovery_options(agent_id, intake_json):
+        # the retry hint is a prompt for the regenerating agent, so it stays in English
         auto_retry_hint = f"Regenerate: be more specific and use concrete local assumptions; reference intake: {intake_json}."
-        if agent_id == "research":
-            question = "Which region should we focus on (city/campus)?"
-        elif agent_id == "brand":
-            question = "Do you prefer playful or professional tone for names?"
-        elif agent_id == "product":
-            question = "What is the target price range for the MVP tier?"
-        elif agent_id == "gtm":
-            question = "Which primary channels should we prioritize (e.g., Instagram/TikTok/Email)?"
-        else:
-            question = "Which audience or goal should we optimize for?"
+        question = m.get(f"review.question_{agent_id}") or m["review.question_default"]
         return {"auto_retry_hint": auto_retry_hint, "user_question": question}
     enriched = []
     for flag in needs:
         aid = flag.get("agent_id")
         agent = {"research":research,"brand":brand,"product":product,"gtm":gtm}.get(aid,{})
         if not _is_fallback(aid, agent):
-            extra = _recovery_options(aid, intake)
+            if intake_json is None:
+                intake_json = json.dumps(intake, ensure_ascii=False)
+            extra = _recovery_options(aid, intake_json)
             f = dict(flag)
             f.update(extra)
             enriched.append(f)
@@ -856,89 +891,108 @@ def req_deliverables_agent(intake, research, brand, product, gtm):
             deliverables[k] = FALLBACK
     return deliverables
 
-def run_required_pipeline(idea_text, language="EN", tone_override=None):
+def run_required_pipeline(idea_text, language="EN", tone_override=None, profile=None, profile_dir=None, record=None, record_dir=None):
     lang = (language or "en").lower()
     if lang in ("en","english","EN"): lang = "en"
     elif lang in ("hi","hindi","HI"): lang = "hi"
     else: lang = "en"
     tone = tone_override or "casual"
-    intake = _new_intake_agent(idea_text, lang, tone)
-    research = _new_research_agent(intake)
-    brand_payload = {
-        "idea": intake.get("idea"),
-        "target_audience": intake.get("target_audience"),
-        "market_snapshot": research.get("market_snapshot"),
-        "key_opportunities": research.get("key_opportunities"),
-        "tone": intake.get("tone")
-    }
-    brand = _new_brand_agent(brand_payload)
-    product = req_product_pricing_agent(intake, research, brand)
-    gtm = _new_gtm_agent({
-        "idea": intake.get("idea"),
-        "target_audience": intake.get("target_audience"),
-        "tone": intake.get("tone"),
-        "chosen_name": brand.get("chosen_name")
-    })
-    # Construct minimal website content from brand/product/gtm
-    features_src = product.get("sizes_and_variants") or []
-    feats = []
-    for i, v in enumerate(features_src[:3]):
-        t = v.get("variant_name") or v.get("name") or f"Tier {i+1}"
-        d = ", ".join(v.get("features", [])[:3]) if isinstance(v.get("features"), list) else "Core features"
-        feats.append({"title": t, "desc": d})
-    landing = {
-        "hero": {"title": brand.get("chosen_name") or intake.get("idea"), "subtitle": (brand.get("taglines") or ["Ready every day"])[0]},
-        "features": feats,
-        "cta": {"text": "See pricing", "href": "pricing.html"}
-    }
-    pricing_list = []
-    for pr in (product.get("pricing") or [])[:3]:
-        pricing_list.append({
-            "name": pr.get("variant_name") or "Tier",
-            "price": (pr.get("price_currency") or "USD") + " " + str(pr.get("suggested_price") or ""),
-            "features": ["core", "support"]
+    prof = start_profile(profile, "run_required_pipeline", profile_dir)
+    rec = start_recording(record, "run_required_pipeline", "auto_startup_builder:run_required_pipeline", {"idea_text": idea_text, "language": language, "tone_override": tone_override}, record_dir, prof)
+    hook = rec or prof
+    try:
+        intake = agent_call(hook, "intake", _new_intake_agent, idea_text, lang, tone)
+        research = agent_call(hook, "research", _new_research_agent, intake)
+        brand_payload = {
+            "idea": intake.get("idea"),
+            "target_audience": intake.get("target_audience"),
+            "market_snapshot": research.get("market_snapshot"),
+            "key_opportunities": research.get("key_opportunities"),
+            "tone": intake.get("tone")
+        }
+        brand = agent_call(hook, "brand", _new_brand_agent, brand_payload)
+        product = agent_call(hook, "product", req_product_pricing_agent, intake, research, brand)
+        gtm = agent_call(hook, "gtm", _new_gtm_agent, {
+            "idea": intake.get("idea"),
+            "target_audience": intake.get("target_audience"),
+            "tone": intake.get("tone"),
+            "chosen_name": brand.get("chosen_name")
         })
-    website = _new_website_agent({
-        "landing_content": landing,
-        "about_content": "We help founders move from idea to traction.",
-        "pricing_content": pricing_list,
-        "contact_content": {"email": "hello@example.com"},
-        "brand_palette": brand.get("color_palette"),
-        "font_stack": (brand.get("font_stack") or "system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif"),
-        "assets_prompts": {"hero": (brand.get("logo_prompts") or ["Minimal geometric mark"])[0]}
-    })
-    # Build export deliverables from new agent
-    export = _new_deliverables_agent({
-        "intake": intake,
-        "research": research,
-        "brand": brand,
-        "product": {"pricing": product.get("pricing"), "sizes_and_variants": product.get("sizes_and_variants"), "mvp_pricing_recommendation": product.get("mvp_pricing_recommendation"), "assumptions": product.get("cost_assumptions"), "confidence": product.get("confidence")},
-        "gtm": gtm,
-        "website": website
-    })
-    # Compose legacy-style deliverables for UI while including files
-    needs = []
-    for aid, conf in [("research", research.get("confidence",0)), ("brand", brand.get("confidence",0)), ("product", product.get("confidence",0)), ("gtm", gtm.get("confidence",0)), ("website", website.get("confidence",0))]:
-        if conf < 0.6:
-            needs.append({"agent_id": aid, "reason": "confidence below threshold", "confidence": conf})
-    # Merge recovery hints from export
-    if isinstance(export.get("needs_review_flags"), list) and export["needs_review_flags"]:
-        needs = export["needs_review_flags"]
-    deliverables = {
-        "market_research": research,
-        "brand_and_naming": brand,
-        "product_pricing": product,
-        "launch_30_day_plan": gtm,
-        "assumptions_and_confidence": export.get("assumptions_and_confidence", {
-            "intake": intake.get("assumptions",[]),
-            "research": research.get("assumptions",[]),
-            "brand": brand.get("assumptions",[]),
-            "product": product.get("cost_assumptions",[]) or product.get("assumptions",[]),
-            "gtm": gtm.get("assumptions",[]),
-            "website": website.get("assumptions",[])
-        }),
-        "needs_review_flags": needs,
-        "export_ready": True,
-        "files": export.get("files")
-    }
-    return {"intake": intake, "research": research, "brand": brand, "product": product, "gtm": gtm, "website": website, "deliverables": deliverables}
\ No newline at end of file
+        # Construct minimal website content from brand/product/gtm
+        features_src = product.get("sizes_and_variants") or []
+        feats = []
+        for i, v in enumerate(features_src[:3]):
+            t = v.get("variant_name") or v.get("name") or f"Tier {i+1}"
+            d = ", ".join(v.get("features", [])[:3]) if isinstance(v.get("features"), list) else "Core features"
+            feats.append({"title": t, "desc": d})
+        m = get_catalog(intake.get("language") or lang)["messages"]
+        landing = {
+            "hero": {"title": brand.get("chosen_name") or intake.get("idea"), "subtitle": (brand.get("taglines") or [m["site.ready_every_day"]])[0]},
+            "features": feats,
+            "cta": {"text": m["site.see_pricing"], "href": "pricing.html"}
+        }
+        pricing_list = []
+        for pr in (product.get("pricing") or [])[:3]:
+            pricing_list.append({
+                "name": pr.get("variant_name") or "Tier",
+                "price": (pr.get("price_currency") or "USD") + " " + str(pr.get("suggested_price") or ""),
+                "features": ["core", "support"]
+            })
+        website = agent_call(hook, "website", _new_website_agent, {
+            "landing_content": landing,
+            "about_content": m["site.about_founders"],
+            "pricing_content": pricing_list,
+            "contact_content": {"email": "hello@example.com"},
+            "brand_palette": brand.get("color_palette"),
+            "font_stack": (brand.get("font_stack") or "system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif"),
+            "assets_prompts": {"hero": (brand.get("logo_prompts") or ["Minimal geometric mark"])[0]}
+        })
+        # Build export deliverables from new agent
+        export = agent_call(hook, "deliverables", _new_deliverables_agent, {
+            "intake": intake,
+            "research": research,
+            "brand": brand,
+            "product": {"pricing": product.get("pricing"), "sizes_and_variants": product.get("sizes_and_variants"), "mvp_pricing_recommendation": product.get("mvp_pricing_recommendation"), "assumptions": product.get("cost_assumptions"), "confidence": product.get("confidence")},
+            "gtm": gtm,
+            "website": website
+        })
+        # Compose legacy-style deliverables for UI while including files
+        confs = [("research", research.get("confidence",0)), ("brand", brand.get("confidence",0)), ("product", product.get("confidence",0)), ("gtm", gtm.get("confidence",0)), ("website", website.get("confidence",0))]
+        needs = _confidence.flags(confs)
+        # Merge recovery hints from export
+        if isinstance(export.get("needs_review_flags"), list) and export["needs_review_flags"]:
+            needs = export["needs_review_flags"]
+        deliverables = {
+            "market_research": research,
+            "brand_and_naming": brand,
+            "product_pricing": product,
+            "launch_30_day_plan": gtm,
+            "assumptions_and_confidence": export.get("assumptions_and_confidence", {
+                "intake": intake.get("assumptions",[]),
+                "research": research.get("assumptions",[]),
+                "brand": brand.get("assumptions",[]),
+                "product": product.get("cost_assumptions",[]) or product.get("assumptions",[]),
+                "gtm": gtm.get("assumptions",[]),
+                "website": website.get("assumptions",[])
+            }),
+            "needs_review_flags": needs,
+            "confidence_score": _confidence.score(confs),
+            "export_ready": True,
+            "files": export.get("files")
+        }
+        result = {"intake": intake, "research": research, "brand": brand, "product": product, "gtm": gtm, "website": website, "deliverables": deliverables}
+        if rec is not None:
+            result["snapshot"] = rec.finish(result)
+        if prof is not None:
+            result["profile"] = prof.finish()
+        return result
+    except Exception as e:
+        if rec is not None:
+            rec.finish(None, error=e)
+        raise
+    finally:
+        if prof is not None:
+            prof.close()
+
+if __name__ == "__main__":
+    main()
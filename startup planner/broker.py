@@ -0,0 +1,151 @@
+import abc
+import json
+import time
+import uuid
+import sqlite3
+import threading
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+class Broker(abc.ABC):
+    # backends implement these; a job is {"id", "payload", "attempts"}
+    @abc.abstractmethod
+    def enqueue(self, payload, job_id=None):
+        pass
+
+    def enqueue_many(self, payloads):
+        # payloads may carry a "job_id"; backends with a bulk insert should override this
+        ids = []
+        for p in payloads:
+            p = dict(p)
+            ids.append(self.enqueue(p, p.pop("job_id", None)))
+        return ids
+
+    @abc.abstractmethod
+    def lease(self, worker_id, limit=1, lease_seconds=DEFAULT_LEASE_SECONDS):
+        pass
+
+    @abc.abstractmethod
+    def ack(self, job_id, worker_id):
+        pass
+
+    @abc.abstractmethod
+    def fail(self, job_id, worker_id, error):
+        pass
+
+    @abc.abstractmethod
+    def stats(self):
+        pass
+
+class SQLiteBroker(Broker):
+    def __init__(self, path, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._db().executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                enqueued REAL NOT NULL,
+                updated REAL NOT NULL,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS jobs_ready ON jobs(status, lease_expires, enqueued);
+        """)
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _tx(self):
+        return _Tx(self._db())
+
+    def enqueue(self, payload, job_id=None):
+        job_id = job_id or uuid.uuid4().hex
+        now = time.time()
+        with self._tx() as db:
+            db.execute("INSERT OR IGNORE INTO jobs (id, payload, enqueued, updated) VALUES (?, ?, ?, ?)", (job_id, json.dumps(payload, ensure_ascii=False), now, now))
+        return job_id
+
+    def enqueue_many(self, payloads):
+        now = time.time()
+        rows = []
+        for p in payloads:
+            p = dict(p)
+            rows.append((p.pop("job_id", None) or uuid.uuid4().hex, json.dumps(p, ensure_ascii=False), now, now))
+        with self._tx() as db:
+            db.executemany("INSERT OR IGNORE INTO jobs (id, payload, enqueued, updated) VALUES (?, ?, ?, ?)", rows)
+        return [r[0] for r in rows]
+
+    def lease(self, worker_id, limit=1, lease_seconds=DEFAULT_LEASE_SECONDS):
+        now = time.time()
+        with self._tx() as db:
+            # expired leases belong to crashed or stalled workers and are handed out again
+            rows = db.execute(
+                "SELECT id, payload, attempts FROM jobs WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?) ORDER BY enqueued LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            jobs = []
+            for job_id, payload, attempts in rows:
+                if attempts >= self.max_attempts:
+                    db.execute("UPDATE jobs SET status = 'failed', lease_owner = NULL, updated = ?, error = COALESCE(error, 'lease expired too many times') WHERE id = ?", (now, job_id))
+                    continue
+                db.execute(
+                    "UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_owner = ?, lease_expires = ?, updated = ? WHERE id = ?",
+                    (worker_id, now + lease_seconds, now, job_id),
+                )
+                jobs.append({"id": job_id, "payload": json.loads(payload), "attempts": attempts + 1})
+        return jobs
+
+    def ack(self, job_id, worker_id):
+        with self._tx() as db:
+            cur = db.execute("UPDATE jobs SET status = 'done', lease_owner = NULL, updated = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'", (time.time(), job_id, worker_id))
+            return cur.rowcount == 1
+
+    def fail(self, job_id, worker_id, error):
+        with self._tx() as db:
+            cur = db.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, lease_owner = NULL, lease_expires = NULL, updated = ?, error = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (self.max_attempts, time.time(), str(error), job_id, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def stats(self):
+        with self._tx() as db:
+            rows = db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+
+class _Tx:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+_BACKENDS = {"sqlite": SQLiteBroker}
+
+def register_broker(scheme, factory):
+    _BACKENDS[scheme] = factory
+
+def open_broker(url, **kwargs):
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return SQLiteBroker(url, **kwargs)
+    if scheme not in _BACKENDS:
+        raise ValueError(f"no broker backend registered for '{scheme}'")
+    return _BACKENDS[scheme](rest, **kwargs)
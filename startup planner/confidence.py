@@ -0,0 +1,147 @@
+import os
+import sys
+import json
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_THRESHOLD = float(os.environ.get("AUTO_FUSION_REVIEW_THRESHOLD", "0.6") or 0.6)
+DEFAULT_WEIGHTS = {"research": 1.0, "brand": 1.0, "product": 1.5, "gtm": 1.0, "website": 0.5}
+LOW_REASON = "confidence below threshold"
+
+def _missing(v):
+    return not isinstance(v, (int, float)) or v != v
+
+def _cut(col, thr):
+    # float32 columns (run archives) compare against the float32 threshold, so 0.7 stored as 0.69999999 is not flagged
+    if np is not None and isinstance(col, np.ndarray):
+        return col.dtype.type(thr)
+    fmt = getattr(col, "format", None) or getattr(col, "typecode", None)
+    return array("f", [thr])[0] if fmt == "f" else thr
+
+class ConfidenceEngine:
+    def __init__(self, threshold=None, thresholds=None, weights=None):
+        self.threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+        self.thresholds = dict(thresholds or {})
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+
+    def threshold_for(self, agent):
+        return self.thresholds.get(agent, self.threshold)
+
+    def low(self, confidences):
+        # confidences: (agent, value) pairs in report order; missing values are never flagged
+        return [(a, v) for a, v in confidences if not _missing(v) and v < self.threshold_for(a)]
+
+    def flags(self, confidences):
+        return [{"agent_id": a, "reason": LOW_REASON, "confidence": v} for a, v in self.low(confidences)]
+
+    def score(self, confidences):
+        total = weight = 0.0
+        for a, v in confidences:
+            if _missing(v):
+                continue
+            w = self.weights.get(a, 1.0)
+            total += w * v
+            weight += w
+        return round(total / weight, 4) if weight else None
+
+    def batch(self, columns):
+        # columns: {agent: sequence of confidences, NaN when missing}, one entry per run
+        agents = list(columns)
+        n = len(columns[agents[0]]) if agents else 0
+        if np is not None:
+            return self._batch_numpy(columns, agents, n)
+        low = {}
+        total = array("d", bytes(8 * n))
+        weight = array("d", bytes(8 * n))
+        flagged = bytearray(n)
+        for a in agents:
+            col = columns[a]
+            cut, w = _cut(col, self.threshold_for(a)), self.weights.get(a, 1.0)
+            rows = []
+            for i, v in enumerate(col):
+                if v != v:
+                    continue
+                total[i] += w * v
+                weight[i] += w
+                if v < cut:
+                    rows.append(i)
+                    flagged[i] = 1
+            low[a] = rows
+        scores = [total[i] / weight[i] if weight[i] else math.nan for i in range(n)]
+        queue = sorted((i for i in range(n) if flagged[i]), key=lambda i: scores[i])
+        return {"runs": n, "scores": scores, "low": low, "review_queue": queue}
+
+    def _batch_numpy(self, columns, agents, n):
+        low = {}
+        total = np.zeros(n)
+        weight = np.zeros(n)
+        flagged = np.zeros(n, dtype=bool)
+        for a in agents:
+            col = np.asarray(columns[a])
+            if col.dtype.kind != "f":
+                col = col.astype("float64")
+            hit = col < _cut(col, self.threshold_for(a))
+            valid = ~np.isnan(col)
+            w = self.weights.get(a, 1.0)
+            total += np.where(valid, col, 0.0) * w
+            weight += valid * w
+            low[a] = np.nonzero(hit)[0]
+            flagged |= hit
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = total / weight
+        idx = np.nonzero(flagged)[0]
+        queue = idx[np.argsort(scores[idx], kind="stable")]
+        return {"runs": n, "scores": scores, "low": low, "review_queue": queue}
+
+def result_columns(results, agents=None):
+    agents = agents or list(DEFAULT_WEIGHTS)
+    cols = {a: array("d") for a in agents}
+    for r in results:
+        for a in agents:
+            v = (r.get(a) or {}).get("confidence")
+            cols[a].append(math.nan if _missing(v) else float(v))
+    return cols
+
+def triage_archive(path, engine=None, limit=50):
+    from run_archive import Archive, CONFIDENCE_AGENTS
+    engine = engine or DEFAULT_ENGINE
+    arc = Archive(path)
+    try:
+        out = engine.batch({a: arc.column(f"{a}_confidence") for a in CONFIDENCE_AGENTS})
+        queue = [int(i) for i in out["review_queue"]]
+        top = queue[:limit]
+        names, audiences = arc.values("chosen_name", top), arc.values("audience", top)
+        return {
+            "runs": out["runs"],
+            "needs_review": len(queue),
+            "low_by_agent": {a: len(rows) for a, rows in out["low"].items()},
+            "queue": [{"row": i, "score": round(float(out["scores"][i]), 4), "chosen_name": nm, "audience": au} for i, nm, au in zip(top, names, audiences)],
+        }
+    finally:
+        arc.close()
+
+DEFAULT_ENGINE = ConfidenceEngine()
+
+if __name__ == "__main__":
+    # confidence.py triage ARCHIVE [--threshold X] [--limit N]
+    if len(sys.argv) < 3 or sys.argv[1] != "triage":
+        print("usage: confidence.py triage ARCHIVE [--threshold X] [--limit N]")
+        sys.exit(1)
+    threshold = None
+    limit = 50
+    i = 3
+    while i < len(sys.argv):
+        if sys.argv[i] == "--threshold" and i+1 < len(sys.argv):
+            threshold = float(sys.argv[i+1])
+            i += 2
+        elif sys.argv[i] == "--limit" and i+1 < len(sys.argv):
+            limit = int(sys.argv[i+1])
+            i += 2
+        else:
+            i += 1
+    print(json.dumps(triage_archive(sys.argv[2], ConfidenceEngine(threshold), limit), indent=2, ensure_ascii=False))
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import threading
+import time
+from types import MappingProxyType
+
+DEFAULT_PATH = os.environ.get("AUTO_FUSION_DATA_PACK") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "agent_data.json")
+CHECK_INTERVAL = 2.0
+SECTIONS = ("legacy", "fusion", "req")
+_REQUIRED = {
+    "competitors": list,
+    "opportunities": list,
+    "brand_names": list,
+    "taglines": list,
+    "pricing_variants": list,
+    "gtm_milestones": dict,
+    "gtm_default_action": str,
+    "hashtags": str,
+}
+# per-entry keys each section's agents read from pricing_variants and competitors
+_VARIANT_KEYS = {
+    "legacy": {"name": str, "price": str},
+    "fusion": {"name": str, "price_suggested": str},
+    "req": {"variant_name": str, "size_options": str, "price_currency": str, "suggested_price": str, "price_rationale": str},
+}
+_COMPETITOR_KEYS = {"legacy": None, "fusion": {"name": str}, "req": {"name": str}}
+
+_lock = threading.Lock()
+_first_lock = threading.Lock()
+_state = {"pack": None, "path": None, "mtime": None, "checked": 0.0}
+
+def _freeze(v):
+    if isinstance(v, dict):
+        return MappingProxyType({k: _freeze(x) for k, x in v.items()})
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+def thaw(v):
+    if isinstance(v, (dict, MappingProxyType)):
+        return {k: thaw(x) for k, x in v.items()}
+    if isinstance(v, tuple):
+        return [thaw(x) for x in v]
+    return v
+
+def _check_entry(where, v, keys):
+    if keys is None:
+        if not isinstance(v, str):
+            raise ValueError(f"{where} must be a str")
+        return
+    if not isinstance(v, dict):
+        raise ValueError(f"{where} must be an object")
+    for key, typ in keys.items():
+        if not isinstance(v.get(key), typ):
+            raise ValueError(f"{where}.{key} must be a {typ.__name__}")
+
+def validate_pack(data):
+    if not isinstance(data, dict):
+        raise ValueError("data pack must be a JSON object")
+    for sec in SECTIONS:
+        s = data.get(sec)
+        if not isinstance(s, dict):
+            raise ValueError(f"data pack missing section '{sec}'")
+        for key, typ in _REQUIRED.items():
+            if not isinstance(s.get(key), typ):
+                raise ValueError(f"{sec}.{key} must be a {typ.__name__}")
+        if sec == "legacy" and not isinstance(s.get("personas"), list):
+            raise ValueError("legacy.personas must be a list")
+        for key in ("opportunities", "brand_names", "taglines") + (("personas",) if sec == "legacy" else ()):
+            for i, v in enumerate(s[key]):
+                _check_entry(f"{sec}.{key}[{i}]", v, None)
+        for i, v in enumerate(s["competitors"]):
+            _check_entry(f"{sec}.competitors[{i}]", v, _COMPETITOR_KEYS[sec])
+        for key in ("brand_names", "taglines", "pricing_variants"):
+            if not s[key]:
+                raise ValueError(f"{sec}.{key} must not be empty")
+        if len(s["pricing_variants"]) < 3:
+            raise ValueError(f"{sec}.pricing_variants needs at least 3 tiers")
+        for i, v in enumerate(s["pricing_variants"]):
+            _check_entry(f"{sec}.pricing_variants[{i}]", v, _VARIANT_KEYS[sec])
+            features = v.get("features")
+            if not isinstance(features, list) or len(features) < 3 or not all(isinstance(f, str) for f in features):
+                raise ValueError(f"{sec}.pricing_variants[{i}].features needs 3 strings")
+        for day, action in s["gtm_milestones"].items():
+            if not str(day).isdigit() or not 1 <= int(day) <= 30:
+                raise ValueError(f"{sec}.gtm_milestones day '{day}' outside 1..30")
+            if not isinstance(action, str):
+                raise ValueError(f"{sec}.gtm_milestones['{day}'] must be a str")
+    return data
+
+def _compile_section(name, s):
+    out = dict(s)
+    milestones = {int(d): a for d, a in s["gtm_milestones"].items()}
+    out["gtm_milestones"] = milestones
+    # calendar[d-1] is the action for day d, so agents never branch per day
+    out["calendar"] = tuple(milestones.get(d, s["gtm_default_action"]) for d in range(1, 31))
+    if name == "legacy":
+        out["brand_scores"] = tuple(round(0.6 + (hash(n) % 40)/100, 2) for n in s["brand_names"])
+    else:
+        out["brand_scores"] = tuple(round(0.6 + (i%35)/100, 2) for i in range(len(s["brand_names"])))
+    return _freeze(out)
+
+def load_pack(path=None):
+    path = path or DEFAULT_PATH
+    with open(path, "r", encoding="utf-8") as f:
+        data = validate_pack(json.load(f))
+    pack = {sec: _compile_section(sec, data[sec]) for sec in SECTIONS}
+    pack["version"] = data.get("version", 1)
+    return MappingProxyType(pack)
+
+def reload_pack(path=None):
+    path = path or _state["path"] or DEFAULT_PATH
+    mtime = os.stat(path).st_mtime
+    pack = load_pack(path)
+    with _lock:
+        _state.update(pack=pack, path=path, mtime=mtime, checked=time.monotonic())
+    return pack
+
+def _first_load():
+    with _first_lock:
+        # parallel agents all hit an empty cache on the first run; only one of them parses the file
+        return _state["pack"] or reload_pack()
+
+def get_pack():
+    pack = _state["pack"]
+    if pack is None:
+        return _first_load()
+    now = time.monotonic()
+    if now - _state["checked"] < CHECK_INTERVAL:
+        return pack
+    _state["checked"] = now
+    try:
+        mtime = os.stat(_state["path"]).st_mtime
+    except OSError:
+        return pack
+    if mtime != _state["mtime"]:
+        try:
+            return reload_pack(_state["path"])
+        except (OSError, ValueError) as e:
+            _state["mtime"] = mtime
+            print(f"data pack reload failed, keeping previous: {e}", file=sys.stderr)
+    return pack
+
+def section(name):
+    return get_pack()[name]
+
+def pack_version():
+    get_pack()
+    return (_state["path"], _state["mtime"])
@@ -0,0 +1,78 @@
+import os
+import json
+from types import MappingProxyType
+
+LOCALES_DIR = os.environ.get("AUTO_FUSION_LOCALES") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+DEFAULT_LANGUAGE = "en"
+
+def _read_catalogs(path):
+    raw = {}
+    for fn in sorted(os.listdir(path)):
+        if not fn.endswith(".json"):
+            continue
+        with open(os.path.join(path, fn), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        meta = data.pop("_meta", {})
+        if not isinstance(meta, dict) or not all(isinstance(v, str) for v in data.values()):
+            raise ValueError(f"catalog {fn} must map message ids to strings")
+        if meta.get("dir", "ltr") not in ("ltr", "rtl"):
+            raise ValueError(f"catalog {fn} has invalid dir '{meta.get('dir')}'")
+        raw[fn[:-5].lower()] = (meta, data)
+    if DEFAULT_LANGUAGE not in raw:
+        raise ValueError(f"default catalog '{DEFAULT_LANGUAGE}.json' missing from {path}")
+    return raw
+
+def _chain(code, raw):
+    chain = []
+    while code and code not in chain:
+        if code not in raw:
+            raise ValueError(f"catalog fallback '{code}' does not exist")
+        chain.append(code)
+        code = raw[code][0].get("fallback")
+    if DEFAULT_LANGUAGE not in chain:
+        chain.append(DEFAULT_LANGUAGE)
+    return chain
+
+def compile_catalogs(path=None):
+    raw = _read_catalogs(path or LOCALES_DIR)
+    compiled = {}
+    aliases = {}
+    for code, (meta, _) in raw.items():
+        chain = _chain(code, raw)
+        # merge back-to-front so the most specific catalog wins; lookups never walk the chain
+        merged = {}
+        for c in reversed(chain):
+            merged.update(raw[c][1])
+        compiled[code] = MappingProxyType({
+            "lang": code,
+            "dir": meta.get("dir", "ltr"),
+            "name": meta.get("name", code),
+            "chain": tuple(chain),
+            "messages": MappingProxyType(merged),
+        })
+        aliases[code] = code
+        for a in meta.get("aliases", []):
+            aliases[a.lower()] = code
+    return MappingProxyType(compiled), aliases
+
+CATALOGS, _ALIASES = compile_catalogs()
+
+def normalize_language(language):
+    key = (language or DEFAULT_LANGUAGE).strip().lower().replace("_", "-")
+    code = _ALIASES.get(key)
+    if code is None:
+        base = key.split("-", 1)[0]
+        code = _ALIASES.get(base, DEFAULT_LANGUAGE)
+        if len(_ALIASES) < 4096:
+            _ALIASES[key] = code
+    return code
+
+def get_catalog(language):
+    return CATALOGS[normalize_language(language)]
+
+def msg(catalog, key, **kw):
+    s = catalog["messages"].get(key, key)
+    return s.format(**kw) if kw else s
+
+def html_open(catalog):
+    return f"<!doctype html><html lang='{catalog['lang']}' dir='{catalog['dir']}'>"
@@ -0,0 +1,126 @@
+import gzip
+import json
+import hashlib
+import mimetypes
+import threading
+from urllib.parse import urlsplit, unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from site_optimizer import COMPRESSIBLE, COMPRESS_MIN_BYTES, MANIFEST_NAME, REVALIDATE_CACHE
+
+_TYPES = {".html": "text/html; charset=utf-8", ".css": "text/css; charset=utf-8", ".txt": "text/plain; charset=utf-8", ".md": "text/markdown; charset=utf-8", ".csv": "text/csv; charset=utf-8", ".json": "application/json"}
+
+def _content_type(name):
+    for ext, ctype in _TYPES.items():
+        if name.endswith(ext):
+            return ctype
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+def _entry(name, data, cache_control, precompressed=None):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    gz = precompressed
+    if gz is None and name.endswith(COMPRESSIBLE) and len(data) >= COMPRESS_MIN_BYTES:
+        gz = gzip.compress(data, compresslevel=6, mtime=0)
+        if len(gz) >= len(data):
+            gz = None
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    return {
+        "body": data,
+        "gzip": gz,
+        "etag": f'"{digest}"',
+        "etag_gzip": f'"{digest}-gz"',
+        "type": _content_type(name),
+        "cache_control": cache_control,
+    }
+
+class PreviewStore:
+    def __init__(self, files=None):
+        self._lock = threading.Lock()
+        self.entries = {}
+        self.version = 0
+        if files:
+            self.update(files)
+
+    def update(self, files, replace=True):
+        policies = {}
+        if MANIFEST_NAME in files:
+            raw = files[MANIFEST_NAME]
+            manifest = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+            policies = {n: e.get("cache_control", REVALIDATE_CACHE) for n, e in manifest.get("files", {}).items()}
+        with self._lock:
+            current = self.entries
+            entries = {} if replace else dict(current)
+            changed = []
+            for name, data in files.items():
+                if name.endswith((".gz", ".br")) and name[:-3] in files:
+                    continue
+                raw = data.encode("utf-8") if isinstance(data, str) else data
+                old = current.get(name)
+                if old is not None and old["body"] == raw:
+                    entries[name] = old
+                    continue
+                entries[name] = _entry(name, raw, policies.get(name, REVALIDATE_CACHE), files.get(name + ".gz"))
+                changed.append(name)
+            removed = [n for n in current if n not in entries]
+            # readers hold a reference to the old dict, so swapping it is atomic for them
+            self.entries = entries
+            if changed or removed:
+                self.version += 1
+        return changed
+
+    def get(self, path):
+        name = unquote(path).lstrip("/") or "index.html"
+        if name.endswith("/"):
+            name += "index.html"
+        return self.entries.get(name)
+
+def make_handler(store):
+    class PreviewHandler(BaseHTTPRequestHandler):
+        server_version = "AutoFusionPreview/1.0"
+
+        def _send(self, head_only):
+            entry = store.get(urlsplit(self.path).path)
+            if entry is None:
+                self.send_error(404, "Not found")
+                return
+            use_gzip = entry["gzip"] is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+            body, etag = (entry["gzip"], entry["etag_gzip"]) if use_gzip else (entry["body"], entry["etag"])
+            inm = self.headers.get("If-None-Match", "")
+            if etag in [t.strip() for t in inm.split(",")] or inm.strip() == "*":
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", entry["cache_control"])
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", entry["type"])
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", entry["cache_control"])
+            self.send_header("Vary", "Accept-Encoding")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            if not head_only:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            self._send(False)
+
+        def do_HEAD(self):
+            self._send(True)
+
+        def log_message(self, fmt, *args):
+            pass
+    return PreviewHandler
+
+def serve_preview(files, host="127.0.0.1", port=8001, store=None):
+    if store is None:
+        store = PreviewStore(files)
+    elif files:
+        store.update(files)
+    server = ThreadingHTTPServer((host, port), make_handler(store))
+    server.daemon_threads = True
+    server.store = store
+    return server
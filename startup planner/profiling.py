@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+import time
+import uuid
+import itertools
+import threading
+import tracemalloc
+
+PROFILE_DIR = os.environ.get("AUTO_FUSION_PROFILE_DIR", "profiles")
+SAMPLE_EVERY = int(os.environ.get("AUTO_FUSION_PROFILE_SAMPLE", "0") or 0)
+TOP_ALLOCATIONS = 25
+
+_counter = itertools.count(1)
+_SNAPSHOT_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+
+def should_profile(profile=None):
+    if profile is not None:
+        return bool(profile)
+    return SAMPLE_EVERY > 0 and next(_counter) % SAMPLE_EVERY == 0
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+def _c_name(fn):
+    mod = getattr(fn, "__module__", None) or "builtins"
+    return f"{mod}:{getattr(fn, '__qualname__', None) or getattr(fn, '__name__', '?')}"
+
+class _StackTracer:
+    # deterministic per-thread tracer; folds self time (microseconds) into collapsed stacks
+    def __init__(self, root, folded, lock):
+        self.stack = [root]
+        self.starts = []
+        self.folded = folded
+        self.lock = lock
+
+    def __call__(self, frame, event, arg):
+        now = time.perf_counter()
+        if event == "call" or event == "c_call":
+            self.stack.append(_frame_name(frame) if event == "call" else _c_name(arg))
+            self.starts.append([now, 0.0])
+        elif event in ("return", "c_return", "c_exception") and self.starts:
+            start, child = self.starts.pop()
+            elapsed = now - start
+            key = ";".join(self.stack)
+            self.stack.pop()
+            with self.lock:
+                self.folded[key] = self.folded.get(key, 0) + int((elapsed - child) * 1e6)
+            if self.starts:
+                self.starts[-1][1] += elapsed
+
+def _start_tracemalloc():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+        _tracemalloc_users += 1
+
+def _stop_tracemalloc():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+class Profiler:
+    def __init__(self, label="run", out_dir=None, allocations=True):
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.label = label
+        self.out_dir = out_dir or PROFILE_DIR
+        self.allocations = allocations
+        self.folded = {}
+        self.agents = {}
+        self.alloc = {}
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self._closed = not allocations
+        if allocations:
+            _start_tracemalloc()
+
+    def call(self, name, fn, *args, **kwargs):
+        before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS) if self.allocations else None
+        tracer = _StackTracer(f"{self.label};{name}", self.folded, self._lock)
+        previous = sys.getprofile()
+        cpu0, wall0 = time.thread_time(), time.perf_counter()
+        sys.setprofile(tracer)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            sys.setprofile(previous)
+            cpu, wall = time.thread_time() - cpu0, time.perf_counter() - wall0
+            stats = None
+            if before is not None:
+                after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+                # concurrent agents share one tracemalloc heap, so parallel stages may see each other's allocations
+                stats = after.compare_to(before, "lineno")
+            with self._lock:
+                self.agents[name] = {"cpu_seconds": round(cpu, 6), "wall_seconds": round(wall, 6)}
+                if stats is not None:
+                    self.alloc[name] = stats[:TOP_ALLOCATIONS]
+                    self.agents[name]["allocated_bytes"] = sum(s.size_diff for s in stats if s.size_diff > 0)
+
+    def close(self):
+        # safe to call more than once; pipelines call it on every exit path so tracemalloc never stays on
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        _stop_tracemalloc()
+
+    def finish(self):
+        self.close()
+        path = os.path.join(self.out_dir, self.run_id)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "stacks.folded"), "w", encoding="utf-8") as f:
+            for stack, us in sorted(self.folded.items()):
+                if us > 0:
+                    f.write(f"{stack} {us}\n")
+        if self.alloc:
+            with open(os.path.join(path, "allocations.txt"), "w", encoding="utf-8") as f:
+                for name, stats in self.alloc.items():
+                    f.write(f"## {name}\n")
+                    for s in stats:
+                        f.write(f"{s}\n")
+                    f.write("\n")
+        summary = {"run_id": self.run_id, "label": self.label, "total_seconds": round(time.perf_counter() - self.started, 6), "agents": self.agents, "dir": path}
+        with open(os.path.join(path, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+def start_profile(profile=None, label="run", out_dir=None):
+    return Profiler(label, out_dir) if should_profile(profile) else None
+
+def agent_call(prof, name, fn, *args, **kwargs):
+    if prof is None:
+        return fn(*args, **kwargs)
+    return prof.call(name, fn, *args, **kwargs)
@@ -0,0 +1,342 @@
+import os
+import sys
+import json
+import mmap
+import math
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+META_NAME = "meta.json"
+LOCK_NAME = ".lock"
+FORMAT_VERSION = 1
+CONFIDENCE_AGENTS = ("research", "brand", "product", "gtm", "website")
+COLUMNS = {
+    "created": "d",
+    "pipeline": "category",
+    "audience": "category",
+    "language": "category",
+    "tone": "category",
+    "chosen_name": "category",
+    "entry_price": "category",
+    "needs_review": "i",
+    **{f"{a}_confidence": "f" for a in CONFIDENCE_AGENTS},
+}
+_NUMPY_TYPES = {"d": "float64", "f": "float32", "i": "int32", "I": "uint32"}
+
+def _first(*values):
+    for v in values:
+        if v not in (None, "", []):
+            return v
+    return None
+
+def extract_row(result, created=None):
+    intake = result.get("intake") or {}
+    brand = result.get("brand") or {}
+    product = result.get("product") or {}
+    deliverables = result.get("deliverables") or {}
+    names = brand.get("names") if isinstance(brand.get("names"), list) else []
+    variants = product.get("variants") if isinstance(product.get("variants"), list) else []
+    pricing = product.get("pricing") if isinstance(product.get("pricing"), list) else []
+    entry_price = None
+    if variants:
+        entry_price = _first(variants[0].get("price_suggested"), variants[0].get("price"))
+    elif pricing:
+        entry_price = f"{pricing[0].get('price_currency') or 'USD'} {pricing[0].get('suggested_price') or ''}".strip()
+    flags = deliverables.get("needs_review_flags")
+    row = {
+        "created": created if created is not None else time.time(),
+        "pipeline": "fusion" if "variants" in product else "required",
+        "audience": _first(intake.get("target_audience"), intake.get("primary_audience")),
+        "language": intake.get("language"),
+        "tone": intake.get("tone"),
+        "chosen_name": _first(brand.get("chosen_name"), names[0].get("name") if names and isinstance(names[0], dict) else None),
+        "entry_price": entry_price,
+        "needs_review": len(flags) if isinstance(flags, list) else 0,
+    }
+    for a in CONFIDENCE_AGENTS:
+        conf = (result.get(a) or {}).get("confidence")
+        row[f"{a}_confidence"] = float(conf) if isinstance(conf, (int, float)) else math.nan
+    return row
+
+def _read_meta(path):
+    with open(os.path.join(path, META_NAME), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported archive version {meta.get('version')}")
+    if meta.get("byteorder") != sys.byteorder:
+        raise ValueError(f"archive was written on a {meta.get('byteorder')}-endian host")
+    return meta
+
+class _ArchiveLock:
+    # exclusive across processes; held from reading meta.json until the new one is in place
+    def __init__(self, path):
+        self.path = os.path.join(path, LOCK_NAME)
+
+    def __enter__(self):
+        self.f = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.f.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    self.f.seek(0)
+                    msvcrt.locking(self.f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.f.fileno(), fcntl.LOCK_UN)
+        else:
+            self.f.seek(0)
+            msvcrt.locking(self.f.fileno(), msvcrt.LK_UNLCK, 1)
+        self.f.close()
+        return False
+
+class ArchiveWriter:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._pending = []
+        with _ArchiveLock(path):
+            self._load()
+
+    def _load(self):
+        # meta.json is the source of truth: bytes past its row count come from a writer that died before committing
+        if os.path.exists(os.path.join(self.path, META_NAME)):
+            meta = _read_meta(self.path)
+            self.rows = meta["rows"]
+            self.dictionaries = meta["dictionaries"]
+        else:
+            self.rows = 0
+            self.dictionaries = {c: [] for c, kind in COLUMNS.items() if kind == "category"}
+        for col, kind in COLUMNS.items():
+            fn = os.path.join(self.path, f"{col}.col")
+            size = self.rows * array("I" if kind == "category" else kind).itemsize
+            if os.path.exists(fn) and os.path.getsize(fn) > size:
+                os.truncate(fn, size)
+
+    def _code(self, codes, col, value):
+        value = "" if value is None else str(value)
+        code = codes[col].get(value)
+        if code is None:
+            code = codes[col][value] = len(self.dictionaries[col])
+            self.dictionaries[col].append(value)
+        return code
+
+    def append(self, result, created=None):
+        self._pending.append(extract_row(result, created))
+
+    def flush(self):
+        if not self._pending:
+            return
+        with _ArchiveLock(self.path):
+            # another writer may have committed since we opened, so reload before encoding
+            self._load()
+            codes = {c: {s: i for i, s in enumerate(vals)} for c, vals in self.dictionaries.items()}
+            for col, kind in COLUMNS.items():
+                buf = array("I" if kind == "category" else kind)
+                for row in self._pending:
+                    buf.append(self._code(codes, col, row[col]) if kind == "category" else row[col])
+                with open(os.path.join(self.path, f"{col}.col"), "ab") as f:
+                    buf.tofile(f)
+            self.rows += len(self._pending)
+            self._pending = []
+            self._write_meta()
+
+    def _write_meta(self):
+        meta = {
+            "version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "rows": self.rows,
+            "columns": {c: ("I" if k == "category" else k) for c, k in COLUMNS.items()},
+            "categories": [c for c, k in COLUMNS.items() if k == "category"],
+            "dictionaries": self.dictionaries,
+        }
+        # meta is written last, so readers never see a row count ahead of the column files
+        tmp = os.path.join(self.path, META_NAME + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, os.path.join(self.path, META_NAME))
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+class Archive:
+    def __init__(self, path):
+        self.path = path
+        self.meta = _read_meta(path)
+        self.rows = self.meta["rows"]
+        self.dictionaries = self.meta["dictionaries"]
+        self._codes = {c: {s: i for i, s in enumerate(vals)} for c, vals in self.dictionaries.items()}
+        self._maps = {}
+        self._cols = {}
+
+    def column(self, name):
+        col = self._cols.get(name)
+        if col is not None:
+            return col
+        fmt = self.meta["columns"][name]
+        width = array(fmt).itemsize
+        if self.rows == 0:
+            col = np.zeros(0, dtype=_NUMPY_TYPES[fmt]) if np is not None else memoryview(array(fmt))
+        else:
+            with open(os.path.join(self.path, f"{name}.col"), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[name] = mm
+            if np is not None:
+                col = np.frombuffer(mm, dtype=_NUMPY_TYPES[fmt], count=self.rows)
+            else:
+                col = memoryview(mm)[:self.rows * width].cast(fmt)
+        self._cols[name] = col
+        return col
+
+    def _match(self, name, cond):
+        col = self.column(name)
+        if name in self._codes:
+            values = cond if isinstance(cond, (list, tuple, set)) else [cond]
+            codes = {self._codes[name][v] for v in values if v in self._codes[name]}
+            if np is not None:
+                return np.isin(col, list(codes))
+            return [c in codes for c in col]
+        if isinstance(cond, tuple):
+            lo, hi = cond
+            if np is not None:
+                m = np.ones(self.rows, dtype=bool)
+                if lo is not None:
+                    m &= col >= lo
+                if hi is not None:
+                    m &= col <= hi
+                return m
+            return [(lo is None or v >= lo) and (hi is None or v <= hi) for v in col]
+        if np is not None:
+            return col == cond
+        return [v == cond for v in col]
+
+    def select(self, **where):
+        # categorical: value or list of values; numeric: value or (min, max) with None for open ends
+        if np is not None:
+            mask = np.ones(self.rows, dtype=bool)
+            for name, cond in where.items():
+                mask &= self._match(name, cond)
+            return np.nonzero(mask)[0]
+        rows = range(self.rows)
+        for name, cond in where.items():
+            m = self._match(name, cond)
+            rows = [i for i in rows if m[i]]
+        return list(rows)
+
+    def values(self, name, rows=None):
+        col = self.column(name)
+        if rows is None:
+            vals = col
+        elif np is not None:
+            vals = col[rows]
+        else:
+            vals = [col[i] for i in rows]
+        if name in self.dictionaries:
+            d = self.dictionaries[name]
+            return [d[c] for c in vals]
+        return vals
+
+    def aggregate(self, field, how="mean", by=None, rows=None):
+        rows = list(range(self.rows)) if rows is None else rows
+        if by is None:
+            return self._reduce(field, how, rows)
+        keys = self.column(by)
+        d = self.dictionaries[by]
+        if np is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+            k = keys[rows]
+            return {d[int(code)]: self._reduce(field, how, rows[k == code]) for code in np.unique(k)}
+        groups = {}
+        for i in rows:
+            groups.setdefault(keys[i], []).append(i)
+        return {d[k]: self._reduce(field, how, idx) for k, idx in groups.items()}
+
+    def _reduce(self, field, how, rows):
+        if how == "count":
+            return len(rows)
+        col = self.column(field)
+        if np is not None:
+            vals = col[np.asarray(rows, dtype=np.int64)].astype("float64")
+            vals = vals[~np.isnan(vals)]
+            vals = vals.tolist()
+        else:
+            vals = [float(col[i]) for i in rows]
+            vals = [v for v in vals if v == v]
+        if not vals:
+            return None
+        if how == "mean":
+            return sum(vals) / len(vals)
+        if how == "min":
+            return min(vals)
+        if how == "max":
+            return max(vals)
+        if how == "sum":
+            return sum(vals)
+        raise ValueError(f"unknown aggregate '{how}'")
+
+    def close(self):
+        self._cols.clear()
+        for mm in self._maps.values():
+            try:
+                mm.close()
+            except BufferError:
+                pass
+        self._maps.clear()
+
+def export_files(archive_path, paths):
+    with ArchiveWriter(archive_path) as w:
+        for p in paths:
+            with open(p, "r", encoding="utf-8") as f:
+                w.append(json.load(f), created=os.path.getmtime(p))
+    return w.rows
+
+def export_store(archive_path, store_path):
+    import sqlite3
+    db = sqlite3.connect(store_path)
+    with ArchiveWriter(archive_path) as w:
+        for body, created in db.execute("SELECT body, created FROM runs ORDER BY created"):
+            w.append(json.loads(body)["result"], created=created)
+            if len(w._pending) >= 10000:
+                w.flush()
+    db.close()
+    return w.rows
+
+if __name__ == "__main__":
+    # run_archive.py export ARCHIVE OUT.json... | export-store ARCHIVE RUNS.db | summary ARCHIVE
+    if len(sys.argv) < 3 or sys.argv[1] not in ("export", "export-store", "summary"):
+        print("usage: run_archive.py export ARCHIVE OUT.json... | export-store ARCHIVE RUNS.db | summary ARCHIVE")
+        sys.exit(1)
+    if sys.argv[1] == "export":
+        print(export_files(sys.argv[2], sys.argv[3:]))
+    elif sys.argv[1] == "export-store":
+        print(export_store(sys.argv[2], sys.argv[3]))
+    else:
+        arc = Archive(sys.argv[2])
+        print(json.dumps({
+            "rows": arc.rows,
+            "by_audience": arc.aggregate("created", "count", by="audience"),
+            "mean_confidence": {a: arc.aggregate(f"{a}_confidence") for a in CONFIDENCE_AGENTS},
+        }, indent=2))
@@ -0,0 +1,147 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+IDEMPOTENCY_TTL = 24 * 3600
+
+def fingerprint(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def encode_record(run_id, request, result):
+    body = json.dumps({"run_id": run_id, "request": request, "result": result}, ensure_ascii=False).encode("utf-8")
+    return {"run_id": run_id, "body": body, "etag": '"' + hashlib.sha256(body).hexdigest()[:20] + '"', "created": time.time()}
+
+class IdempotencyConflict(Exception):
+    pass
+
+class RunStore:
+    def __init__(self, max_runs=10000, max_keys=100000):
+        self._lock = threading.Lock()
+        self._runs = OrderedDict()
+        self._keys = OrderedDict()
+        self._run_keys = {}
+        self.max_runs = max_runs
+        self.max_keys = max_keys
+
+    def put(self, run_id, request, result):
+        rec = encode_record(run_id, request, result)
+        with self._lock:
+            self._runs[run_id] = rec
+            self._runs.move_to_end(run_id)
+            self._evict_runs()
+        return rec
+
+    def _evict_runs(self):
+        while len(self._runs) > self.max_runs:
+            run_id, _ = self._runs.popitem(last=False)
+            self._forget(run_id)
+
+    def _forget(self, run_id):
+        # an evicted run takes its idempotency key with it, so no key points at a missing run
+        key = self._run_keys.pop(run_id, None)
+        entry = self._keys.get(key) if key is not None else None
+        if entry is not None and entry["run_id"] == run_id:
+            del self._keys[key]
+
+    def get(self, run_id):
+        with self._lock:
+            rec = self._runs.get(run_id)
+            if rec is not None:
+                self._runs.move_to_end(run_id)
+            return rec
+
+    def claim(self, key, fp):
+        # returns (entry, owner); only the owner computes, everyone else waits on entry["done"]
+        now = time.time()
+        with self._lock:
+            while self._keys:
+                oldest = next(iter(self._keys.values()))
+                if len(self._keys) <= self.max_keys and now - oldest["created"] < IDEMPOTENCY_TTL:
+                    break
+                _, old = self._keys.popitem(last=False)
+                self._run_keys.pop(old["run_id"], None)
+            entry = self._keys.get(key)
+            if entry is not None:
+                if entry["fingerprint"] != fp:
+                    raise IdempotencyConflict(f"idempotency key '{key}' was used with a different request")
+                return entry, False
+            entry = {"fingerprint": fp, "run_id": None, "error": None, "created": now, "done": threading.Event()}
+            self._keys[key] = entry
+            return entry, True
+
+    def finish(self, key, entry, run_id=None, error=None):
+        with self._lock:
+            entry["run_id"] = run_id
+            entry["error"] = error
+            if error is not None and self._keys.get(key) is entry:
+                # failed runs release the key so a retry recomputes
+                del self._keys[key]
+            elif run_id is not None and self._keys.get(key) is entry:
+                self._run_keys[run_id] = key
+        entry["done"].set()
+
+    def release(self, key, entry):
+        # drops a finished key whose run is no longer stored; a no-op if the key was already reclaimed
+        with self._lock:
+            if self._keys.get(key) is entry:
+                del self._keys[key]
+                self._run_keys.pop(entry["run_id"], None)
+
+class SQLiteRunStore(RunStore):
+    # runs persist in SQLite so every worker process shares them; idempotency keys stay per process
+    def __init__(self, path, max_runs=10000, max_keys=100000):
+        super().__init__(max_runs=max_runs, max_keys=max_keys)
+        self.path = path
+        self._local = threading.local()
+        db = self._db()
+        db.execute("CREATE TABLE IF NOT EXISTS runs (run_id TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT NOT NULL, created REAL NOT NULL)")
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _cache(self, rec):
+        with self._lock:
+            self._runs[rec["run_id"]] = rec
+            self._runs.move_to_end(rec["run_id"])
+            self._evict_runs()
+        return rec
+
+    def _forget(self, run_id):
+        # runs evicted from the cache are still in SQLite, so their keys stay valid
+        pass
+
+    def put(self, run_id, request, result):
+        rec = encode_record(run_id, request, result)
+        db = self._db()
+        # first writer wins, so a job re-run after a lost ack leaves the stored result untouched
+        db.execute("INSERT OR IGNORE INTO runs (run_id, body, etag, created) VALUES (?, ?, ?, ?)", (run_id, rec["body"], rec["etag"], rec["created"]))
+        return self._cache(self._load(run_id) or rec)
+
+    def _load(self, run_id):
+        row = self._db().execute("SELECT body, etag, created FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            return None
+        return {"run_id": run_id, "body": bytes(row[0]), "etag": row[1], "created": row[2]}
+
+    def get(self, run_id):
+        rec = super().get(run_id)
+        if rec is None:
+            rec = self._load(run_id)
+            if rec is not None:
+                self._cache(rec)
+        return rec
+
+    def has(self, run_id):
+        with self._lock:
+            if run_id in self._runs:
+                return True
+        return self._db().execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone() is not None
@@ -0,0 +1,223 @@
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+LANES = ("interactive", "batch")
+WAIT_SAMPLES = 2048
+TENANT_IDLE_SECONDS = 300
+SWEEP_INTERVAL = 60
+MAX_TENANTS = 10000
+
+class QueueFull(Exception):
+    pass
+
+def _default_burst(rate):
+    # the bucket must hold at least one token, or a tenant slower than 1 job/s never becomes eligible
+    return max(1, rate) if rate else 0
+
+class _Tenant:
+    def __init__(self, name, weight=1.0, max_concurrency=None, rate=None, burst=None, max_queued=None):
+        self.name = name
+        self.weight = weight
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst if burst is not None else _default_burst(rate)
+        self.max_queued = max_queued
+        self.tokens = self.burst
+        self.refilled = time.monotonic()
+        self.queues = {lane: deque() for lane in LANES}
+        self.vtime = {lane: 0.0 for lane in LANES}
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.configured = False
+        self.last_active = time.monotonic()
+
+    def idle(self):
+        return self.running == 0 and not any(self.queues.values())
+
+    def refill(self, now):
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+
+    def eligible(self, now):
+        if self.max_concurrency is not None and self.running >= self.max_concurrency:
+            return False
+        if self.rate:
+            self.refill(now)
+            return self.tokens >= 1
+        return True
+
+class Scheduler:
+    def __init__(self, workers=4, reserved_interactive=1, default_weight=1.0, default_max_concurrency=None, default_rate=None, default_burst=None, default_max_queued=10000):
+        if reserved_interactive >= workers:
+            raise ValueError("reserved_interactive must leave at least one worker for batch work")
+        if default_burst is not None and default_burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.workers = workers
+        self.reserved_interactive = reserved_interactive
+        self.defaults = {"weight": default_weight, "max_concurrency": default_max_concurrency, "rate": default_rate, "burst": default_burst, "max_queued": default_max_queued}
+        self._cond = threading.Condition()
+        self._tenants = {}
+        self._pending = {lane: set() for lane in LANES}
+        # start tag of the last job dispatched per lane; arriving tenants are floored here
+        self._vclock = {lane: 0.0 for lane in LANES}
+        self._swept = time.monotonic()
+        self._waits = {lane: deque(maxlen=WAIT_SAMPLES) for lane in LANES}
+        self._threads = []
+        self._stopping = False
+
+    def configure_tenant(self, tenant, **limits):
+        for k in limits:
+            if k not in ("weight", "max_concurrency", "rate", "burst", "max_queued"):
+                raise ValueError(f"unknown tenant limit '{k}'")
+        if limits.get("burst") is not None and limits["burst"] < 1:
+            raise ValueError("burst must be at least 1")
+        with self._cond:
+            t = self._tenant(tenant)
+            t.configured = True
+            for k, v in limits.items():
+                setattr(t, k, v)
+            if "rate" in limits and limits.get("burst") is None:
+                t.burst = _default_burst(t.rate)
+            t.tokens = min(t.tokens, t.burst) if t.rate else t.burst
+            self._cond.notify_all()
+
+    def _tenant(self, name):
+        t = self._tenants.get(name)
+        if t is None:
+            t = self._tenants[name] = _Tenant(name, **self.defaults)
+        return t
+
+    def _sweep(self, now):
+        # tenants created implicitly from request headers are dropped once idle, so the map stays bounded
+        if now - self._swept < SWEEP_INTERVAL and len(self._tenants) < MAX_TENANTS:
+            return
+        self._swept = now
+        ttl = TENANT_IDLE_SECONDS if len(self._tenants) < MAX_TENANTS else 0
+        for name in [n for n, t in self._tenants.items() if not t.configured and t.idle() and now - t.last_active >= ttl]:
+            del self._tenants[name]
+
+    def start(self):
+        with self._cond:
+            if self._threads:
+                return self
+            self._stopping = False
+            for i in range(self.workers):
+                th = threading.Thread(target=self._work, args=(i < self.reserved_interactive,), name=f"scheduler-{i}", daemon=True)
+                self._threads.append(th)
+                th.start()
+        return self
+
+    def shutdown(self, wait=True):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if wait:
+            for th in self._threads:
+                th.join()
+        self._threads = []
+
+    def submit(self, tenant, lane, fn, *args, **kwargs):
+        if lane not in LANES:
+            raise ValueError(f"lane must be one of {LANES}")
+        fut = Future()
+        with self._cond:
+            now = time.monotonic()
+            self._sweep(now)
+            t = self._tenant(tenant)
+            t.last_active = now
+            q = t.queues[lane]
+            if t.max_queued is not None and len(t.queues["interactive"]) + len(t.queues["batch"]) >= t.max_queued:
+                t.rejected += 1
+                raise QueueFull(f"tenant '{tenant}' has {t.max_queued} queued jobs")
+            if not q:
+                # a tenant returning from idle starts at the lane's virtual clock instead of cashing in saved credit
+                t.vtime[lane] = max(t.vtime[lane], self._vclock[lane])
+                self._pending[lane].add(tenant)
+            q.append((fut, fn, args, kwargs, now))
+            t.submitted += 1
+            self._cond.notify_all()
+        return fut
+
+    def _pick(self, interactive_only, now):
+        for lane in (LANES[:1] if interactive_only else LANES):
+            best = None
+            for name in self._pending[lane]:
+                t = self._tenants[name]
+                if (best is None or t.vtime[lane] < best.vtime[lane]) and t.eligible(now):
+                    best = t
+            if best is not None:
+                job = best.queues[lane].popleft()
+                if not best.queues[lane]:
+                    self._pending[lane].discard(best.name)
+                self._vclock[lane] = max(self._vclock[lane], best.vtime[lane])
+                best.vtime[lane] += 1.0 / best.weight
+                best.running += 1
+                if best.rate:
+                    best.tokens -= 1
+                self._waits[lane].append(now - job[4])
+                return best, job
+        return None, None
+
+    def _retry_after(self, interactive_only, now):
+        delay = None
+        for lane in (LANES[:1] if interactive_only else LANES):
+            for name in self._pending[lane]:
+                t = self._tenants[name]
+                if t.rate and (t.max_concurrency is None or t.running < t.max_concurrency):
+                    d = max(0.0, (1 - t.tokens) / t.rate)
+                    delay = d if delay is None else min(delay, d)
+        return delay
+
+    def _work(self, interactive_only):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    now = time.monotonic()
+                    tenant, job = self._pick(interactive_only, now)
+                    if job is not None:
+                        break
+                    self._cond.wait(self._retry_after(interactive_only, now))
+            fut, fn, args, kwargs, _ = job
+            if fut.set_running_or_notify_cancel():
+                try:
+                    fut.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    fut.set_exception(e)
+            with self._cond:
+                tenant.running -= 1
+                tenant.completed += 1
+                tenant.last_active = time.monotonic()
+                self._cond.notify_all()
+
+    def metrics(self):
+        with self._cond:
+            lanes = {}
+            for lane in LANES:
+                waits = sorted(self._waits[lane])
+                n = len(waits)
+                lanes[lane] = {
+                    "queued": sum(len(t.queues[lane]) for t in self._tenants.values()),
+                    "wait_samples": n,
+                    "wait_p50": waits[n // 2] if n else 0.0,
+                    "wait_p95": waits[min(n - 1, int(n * 0.95))] if n else 0.0,
+                    "wait_max": waits[-1] if n else 0.0,
+                }
+            tenants = {
+                name: {
+                    "queued": {lane: len(t.queues[lane]) for lane in LANES},
+                    "running": t.running,
+                    "submitted": t.submitted,
+                    "completed": t.completed,
+                    "rejected": t.rejected,
+                    "weight": t.weight,
+                }
+                for name, t in self._tenants.items()
+            }
+            return {"workers": self.workers, "reserved_interactive": self.reserved_interactive, "lanes": lanes, "tenants": tenants}
@@ -0,0 +1,136 @@
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+NUM_PERM = 64
+BAND_ROWS = 2
+DEFAULT_THRESHOLD = 0.5
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 64) - 1
+
+STOPWORDS = {"a", "an", "the", "for", "of", "to", "and", "or", "in", "on", "at", "with", "by", "from", "my", "our", "your", "their", "that", "this", "based", "who", "which"}
+CONCEPTS = {
+    "campus": "student", "college": "student", "university": "student", "school": "student", "dorm": "student", "hostel": "student",
+    "kid": "family", "child": "family", "parent": "family",
+    "dairy": "milk",
+    "subscribe": "subscription", "plan": "subscription", "membership": "subscription",
+    "deliver": "delivery", "shipping": "delivery", "doorstep": "delivery",
+    "coder": "developer", "engineer": "developer", "programmer": "developer",
+    "application": "app", "mobile": "app",
+}
+
+def _stem(tok):
+    for suffix in ("ies", "ing", "es", "ed", "s"):
+        if tok.endswith(suffix) and len(tok) - len(suffix) >= 3:
+            tok = tok[:-len(suffix)] + ("y" if suffix == "ies" else "")
+            break
+    return tok
+
+def features(text):
+    out = set()
+    for tok in re.findall(r"[a-z0-9]+", (text or "").lower()):
+        if tok in STOPWORDS:
+            continue
+        tok = CONCEPTS.get(tok) or CONCEPTS.get(_stem(tok)) or _stem(tok)
+        out.add(tok)
+    return frozenset(out)
+
+def _seeded(i):
+    h = hashlib.blake2b(f"perm-{i}".encode(), digest_size=16).digest()
+    return int.from_bytes(h[:8], "little") % _PRIME | 1, int.from_bytes(h[8:], "little") % _PRIME
+
+_PERMS = [_seeded(i) for i in range(NUM_PERM)]
+
+def _feature_hash(f):
+    return int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "little")
+
+def signature(feats):
+    if not feats:
+        return (_MASK,) * NUM_PERM
+    hashes = [_feature_hash(f) for f in feats]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+class SimilarityIndex:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, max_entries=50000):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _bands(self, scope, sig):
+        for i in range(0, NUM_PERM, BAND_ROWS):
+            yield (scope, i, sig[i:i+BAND_ROWS])
+
+    def add(self, idea, scope, result):
+        result = {k: v for k, v in result.items() if k not in ("profile", "reuse")}
+        feats = features(idea)
+        sig = signature(feats)
+        with self._lock:
+            eid = self._next_id
+            self._next_id += 1
+            self._entries[eid] = {"id": eid, "idea": idea, "scope": scope, "features": feats, "signature": sig, "result": result}
+            for band in self._bands(scope, sig):
+                self._buckets.setdefault(band, []).append(eid)
+            while len(self._entries) > self.max_entries:
+                self._evict()
+        return eid
+
+    def _evict(self):
+        eid, entry = self._entries.popitem(last=False)
+        for band in self._bands(entry["scope"], entry["signature"]):
+            ids = self._buckets.get(band)
+            if ids:
+                ids.remove(eid)
+                if not ids:
+                    del self._buckets[band]
+
+    def lookup(self, idea, scope, threshold=None):
+        threshold = self.threshold if threshold is None else threshold
+        feats = features(idea)
+        sig = signature(feats)
+        best, best_score = None, 0.0
+        with self._lock:
+            seen = set()
+            for band in self._bands(scope, sig):
+                for eid in self._buckets.get(band, ()):
+                    if eid in seen:
+                        continue
+                    seen.add(eid)
+                    entry = self._entries[eid]
+                    score = jaccard(feats, entry["features"])
+                    if score > best_score:
+                        best, best_score = entry, score
+            if best is not None and best_score >= threshold:
+                self.hits += 1
+                self._entries.move_to_end(best["id"])
+                return {"idea": best["idea"], "score": round(best_score, 4), "result": best["result"]}
+            self.misses += 1
+        return None
+
+    def reuse(self, idea, scope, threshold=None, adapt=None):
+        # returns a copy of the closest stored result, or None; adapt(copy) re-renders the idea-derived
+        # fields for the new idea and may return None to decline the match
+        hit = self.lookup(idea, scope, threshold)
+        if hit is None:
+            return None
+        result = json.loads(json.dumps(hit["result"]))
+        if adapt is not None and hit["idea"] != idea:
+            result = adapt(result)
+            if result is None:
+                return None
+        result["reuse"] = {"matched_idea": hit["idea"], "score": hit["score"]}
+        return result
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,204 @@
+import os
+import re
+import gzip
+import json
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_FILES = ["index.html", "about.html", "pricing.html", "contact.html", "styles.css", "README_deploy.txt"]
+MANIFEST_NAME = "asset-manifest.json"
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+COMPRESS_MIN_BYTES = 256
+COMPRESSIBLE = (".html", ".css", ".js", ".json", ".txt", ".svg", ".csv", ".md")
+
+_BLOCK_TAGS = {
+    "html", "head", "body", "header", "main", "section", "footer", "nav", "div", "ul", "ol", "li",
+    "article", "form", "h1", "h2", "h3", "h4", "h5", "h6", "p", "meta", "link", "title", "script",
+    "style", "blockquote", "!doctype", "table", "tr", "td", "th", "br", "hr",
+}
+_RAW_BLOCK = re.compile(r"(<(script|style|pre|textarea)\b[^>]*>.*?</\2\s*>)", re.S | re.I)
+_BETWEEN_TAGS = re.compile(r"(</?([!a-zA-Z][\w-]*)[^>]*>)\s+(?=</?([!a-zA-Z][\w-]*))")
+_ALWAYS_CRITICAL = {"", "*", "html", "body", ":root"}
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    parts = re.split(r"([{};])", css)
+    out = []
+    for i in range(0, len(parts), 2):
+        text = parts[i]
+        delim = parts[i+1] if i + 1 < len(parts) else ""
+        if delim == "{":
+            # selectors and at-rule preludes: a space before ':' is a descendant combinator
+            text = re.sub(r"\s*([,>])\s*", r"\1", text)
+        else:
+            text = re.sub(r"\s*([:,>])\s*", r"\1", text)
+        out.append(text.strip() + delim)
+    return "".join(out).replace(";}", "}")
+
+def _collapse_between(m):
+    left, right = m.group(2).lower(), m.group(3).lower()
+    return m.group(1) if left in _BLOCK_TAGS or right in _BLOCK_TAGS else m.group(1) + " "
+
+def minify_html(html):
+    parts = _RAW_BLOCK.split(html)
+    out = []
+    i = 0
+    while i < len(parts):
+        text = parts[i]
+        text = re.sub(r"<!--(?!\[).*?-->", "", text, flags=re.S)
+        text = re.sub(r"\s+", " ", text)
+        text = _BETWEEN_TAGS.sub(_collapse_between, text)
+        if i > 0 and parts[i-1].lower() in ("script", "style"):
+            text = text.lstrip()
+        if i + 2 < len(parts) and parts[i+2].lower() in ("script", "style"):
+            text = text.rstrip()
+        out.append(text)
+        if i + 1 < len(parts):
+            block, tag = parts[i+1], parts[i+2].lower()
+            if tag == "style":
+                open_end = block.index(">") + 1
+                close_start = block.lower().rindex("</style")
+                block = block[:open_end] + minify_css(block[open_end:close_start]) + block[close_start:]
+            out.append(block)
+        i += 3
+    return "".join(out).strip()
+
+def _page_tokens(html):
+    tags = {t.lower() for t in re.findall(r"<([a-zA-Z][\w-]*)", html)}
+    classes = set()
+    for c in re.findall(r"class=['\"]([^'\"]*)['\"]", html):
+        classes.update(c.split())
+    ids = set(re.findall(r"id=['\"]([^'\"]*)['\"]", html))
+    return tags, classes, ids
+
+def _selector_matches(selector, tokens):
+    tags, classes, ids = tokens
+    sel = re.sub(r"::?[\w-]+(\([^)]*\))?", "", selector)
+    sel = re.sub(r"\[[^\]]*\]", "", sel).strip()
+    if sel in _ALWAYS_CRITICAL:
+        return True
+    for compound in re.split(r"[\s>+~]+", sel):
+        if not compound or compound == "*":
+            continue
+        m = re.match(r"^([a-zA-Z][\w-]*)?", compound)
+        if m.group(1) and m.group(1).lower() not in tags:
+            return False
+        if any(c not in classes for c in re.findall(r"\.([\w-]+)", compound)):
+            return False
+        if any(x not in ids for x in re.findall(r"#([\w-]+)", compound)):
+            return False
+    return True
+
+def _split_rules(css):
+    rules = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i+1].strip())
+                start = i + 1
+    return [r for r in rules if r]
+
+def critical_css(css, html):
+    tokens = _page_tokens(html)
+    def pick(block):
+        kept = []
+        for rule in _split_rules(block):
+            head, body = rule.split("{", 1)
+            head = head.strip()
+            if head.startswith("@media") or head.startswith("@supports"):
+                inner = pick(body[:-1])
+                if inner:
+                    kept.append(head + "{" + inner + "}")
+            elif head.startswith("@"):
+                kept.append(rule)
+            elif any(_selector_matches(s, tokens) for s in head.split(",")):
+                kept.append(rule)
+        return "".join(kept)
+    return pick(minify_css(css))
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{content_hash(data)}{ext}"
+
+def _inline_critical(html, css_name, hashed_css, critical):
+    link = re.compile(r"<link rel=['\"]stylesheet['\"] href=['\"]" + re.escape(css_name) + r"['\"]\s*/?>")
+    deferred = (
+        f"<style>{critical}</style>"
+        f"<link rel='preload' href='{hashed_css}' as='style' onload=\"this.onload=null;this.rel='stylesheet'\">"
+        f"<noscript><link rel='stylesheet' href='{hashed_css}'></noscript>"
+    )
+    return link.sub(lambda m: deferred, html, count=1)
+
+def _compress(out, name, data):
+    if not name.endswith(COMPRESSIBLE) or len(data) < COMPRESS_MIN_BYTES:
+        return {}
+    sizes = {}
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        out[name + ".gz"] = gz
+        sizes["gzip_size"] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            out[name + ".br"] = br
+            sizes["br_size"] = len(br)
+    return sizes
+
+def optimize_site(files, css_name="styles.css"):
+    out = {}
+    manifest = {"assets": {}, "files": {}}
+    css = files.get(css_name)
+    hashed_css = None
+    if css is not None:
+        css_min = minify_css(css).encode("utf-8")
+        hashed_css = hashed_name(css_name, css_min)
+        out[hashed_css] = css_min
+        manifest["assets"][css_name] = hashed_css
+    for name, content in files.items():
+        if name == css_name:
+            continue
+        if name.endswith(".html"):
+            html = minify_html(content)
+            if hashed_css:
+                html = _inline_critical(html, css_name, hashed_css, critical_css(css, html))
+            out[name] = html.encode("utf-8")
+        else:
+            out[name] = content.encode("utf-8") if isinstance(content, str) else content
+        manifest["assets"].setdefault(name, name)
+    for name in list(out):
+        data = out[name]
+        entry = {
+            "hash": content_hash(data),
+            "size": len(data),
+            "cache_control": IMMUTABLE_CACHE if name == hashed_css else REVALIDATE_CACHE,
+        }
+        entry.update(_compress(out, name, data))
+        manifest["files"][name] = entry
+    out[MANIFEST_NAME] = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+    return out
+
+def write_site(optimized, site_dir):
+    os.makedirs(site_dir, exist_ok=True)
+    for name, data in optimized.items():
+        path = os.path.join(site_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+def site_listing(optimized, root="site"):
+    # zip_structure.txt for an optimized export, built from the files optimize_site produced
+    return "\n".join([f"{root}/{n}" for n in sorted(optimized)] + [f"{root}/assets/"])
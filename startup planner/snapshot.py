@@ -0,0 +1,291 @@
+import os
+import sys
+import gzip
+import json
+import time
+import uuid
+import hashlib
+import inspect
+import itertools
+import importlib
+import threading
+import platform
+
+SNAPSHOT_DIR = os.environ.get("AUTO_FUSION_SNAPSHOT_DIR", "snapshots")
+SAMPLE_EVERY = int(os.environ.get("AUTO_FUSION_RECORD_SAMPLE", "0") or 0)
+FORMAT_VERSION = 1
+MAX_DIFFS = 20
+RESULT_ONLY_KEYS = ("profile", "snapshot", "reuse")
+
+_counter = itertools.count(1)
+_versions = {}
+
+def should_record(record=None):
+    if record is not None:
+        return bool(record)
+    return SAMPLE_EVERY > 0 and next(_counter) % SAMPLE_EVERY == 0
+
+def _error_name(e):
+    return f"{type(e).__name__}: {e}"
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+def fn_ref(fn):
+    mod = fn.__module__
+    if mod == "__main__":
+        # agents defined in a script run directly are replayed from the importable module
+        mod = os.path.splitext(os.path.basename(getattr(sys.modules["__main__"], "__file__", "") or "__main__"))[0]
+    return f"{mod}:{fn.__qualname__}"
+
+def fn_version(fn):
+    ref = fn_ref(fn)
+    v = _versions.get(ref)
+    if v is None:
+        try:
+            src = inspect.getsource(fn).encode("utf-8")
+        except (OSError, TypeError):
+            src = getattr(getattr(fn, "__code__", None), "co_code", ref.encode("utf-8"))
+        v = _versions[ref] = hashlib.sha256(src).hexdigest()[:12]
+    return v
+
+def resolve(ref):
+    mod, _, qualname = ref.partition(":")
+    obj = importlib.import_module(mod)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+def _environment():
+    env = {"python": platform.python_version()}
+    try:
+        from content_pack import pack_version
+        path, _ = pack_version()
+        with open(path, "rb") as f:
+            env["data_pack"] = {"path": os.path.basename(path), "sha256": hashlib.sha256(f.read()).hexdigest()[:16]}
+    except Exception:
+        pass
+    return env
+
+class Recorder:
+    def __init__(self, label, entry, inputs, out_dir=None, inner=None):
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.label = label
+        self.entry = entry
+        self.inputs = json.loads(_canonical(inputs))
+        self.out_dir = out_dir or SNAPSHOT_DIR
+        self.inner = inner
+        self.stages = []
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.written = None
+
+    def call(self, name, fn, *args, **kwargs):
+        # inputs are captured before the call so later mutation by other stages cannot leak in
+        stage = {"name": name, "fn": fn_ref(fn), "version": fn_version(fn), "args": json.loads(_canonical(list(args))), "kwargs": json.loads(_canonical(kwargs))}
+        t0 = time.perf_counter()
+        try:
+            out = self.inner.call(name, fn, *args, **kwargs) if self.inner is not None else fn(*args, **kwargs)
+        except Exception as e:
+            stage["error"] = _error_name(e)
+            raise
+        else:
+            stage["output"] = json.loads(_canonical(out))
+            return out
+        finally:
+            stage["wall_seconds"] = round(time.perf_counter() - t0, 6)
+            with self._lock:
+                self.stages.append(stage)
+
+    def _compact(self, result):
+        # values already stored as a stage output are replaced by {"$stage": name}
+        by_value = {}
+        for s in self.stages:
+            if "output" in s:
+                by_value.setdefault(_canonical(s["output"]), s["name"])
+        def ref(v):
+            name = by_value.get(_canonical(v))
+            return {"$stage": name} if name is not None else v
+        stages = []
+        for s in self.stages:
+            s = dict(s)
+            s["args"] = [ref(a) for a in s["args"]]
+            s["kwargs"] = {k: ref(v) for k, v in s["kwargs"].items()}
+            stages.append(s)
+        body = {k: ref(v) for k, v in result.items() if k not in RESULT_ONLY_KEYS}
+        return stages, body
+
+    def finish(self, result, error=None):
+        # failing runs are written too (result None, error set) so replay can check the failure still reproduces
+        if self.written is not None:
+            return self.written
+        stages, body = self._compact(json.loads(_canonical(result or {})))
+        snap = {
+            "version": FORMAT_VERSION,
+            "run_id": self.run_id,
+            "label": self.label,
+            "entry": self.entry,
+            "created": time.time(),
+            "inputs": self.inputs,
+            "env": _environment(),
+            "total_seconds": round(time.perf_counter() - self.started, 6),
+            # profiled runs carry tracer overhead in every recorded timing
+            "profiled": self.inner is not None,
+            "stages": stages,
+            "result": body,
+        }
+        if error is not None:
+            snap["error"] = _error_name(error)
+        os.makedirs(self.out_dir, exist_ok=True)
+        path = os.path.join(self.out_dir, f"{self.run_id}.json.gz")
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(snap, f, ensure_ascii=False, separators=(",", ":"))
+        self.written = {"run_id": self.run_id, "path": path, "stages": len(stages)}
+        return self.written
+
+def start_recording(record, label, entry, inputs, out_dir=None, inner=None):
+    return Recorder(label, entry, inputs, out_dir, inner) if should_record(record) else None
+
+def load_snapshot(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        snap = json.load(f)
+    if snap.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported snapshot version {snap.get('version')}")
+    outputs = {s["name"]: s.get("output") for s in snap["stages"]}
+    def expand(v):
+        if isinstance(v, dict) and len(v) == 1 and "$stage" in v:
+            return json.loads(_canonical(outputs[v["$stage"]]))
+        return v
+    for s in snap["stages"]:
+        s["args"] = [expand(a) for a in s["args"]]
+        s["kwargs"] = {k: expand(v) for k, v in s["kwargs"].items()}
+    snap["result"] = {k: expand(v) for k, v in snap["result"].items()}
+    return snap
+
+def diff(old, new, path="$", out=None, limit=MAX_DIFFS):
+    out = [] if out is None else out
+    if len(out) >= limit:
+        return out
+    if isinstance(old, dict) and isinstance(new, dict):
+        for k in sorted(set(old) | set(new), key=str):
+            if k not in new:
+                out.append(f"{path}.{k}: removed")
+            elif k not in old:
+                out.append(f"{path}.{k}: added")
+            else:
+                diff(old[k], new[k], f"{path}.{k}", out, limit)
+            if len(out) >= limit:
+                break
+    elif isinstance(old, list) and isinstance(new, list):
+        if len(old) != len(new):
+            out.append(f"{path}: length {len(old)} -> {len(new)}")
+        for i, (a, b) in enumerate(zip(old, new)):
+            diff(a, b, f"{path}[{i}]", out, limit)
+            if len(out) >= limit:
+                break
+    elif old != new:
+        out.append(f"{path}: {json.dumps(old, ensure_ascii=False)[:60]} -> {json.dumps(new, ensure_ascii=False)[:60]}")
+    return out
+
+def replay(snap, end_to_end=False):
+    # each stage re-runs in isolation on exactly the inputs production passed it
+    report = {"run_id": snap["run_id"], "label": snap["label"], "stages": [], "env_changed": snap.get("env") != _environment(), "profiled": snap.get("profiled", False), "error": snap.get("error")}
+    for s in snap["stages"]:
+        row = {"name": s["name"], "recorded_seconds": s["wall_seconds"], "diffs": []}
+        try:
+            fn = resolve(s["fn"])
+            row["version_changed"] = fn_version(fn) != s["version"]
+            args, kwargs = json.loads(_canonical(s["args"])), json.loads(_canonical(s["kwargs"]))
+            t0 = time.perf_counter()
+            out = fn(*args, **kwargs)
+            row["replay_seconds"] = round(time.perf_counter() - t0, 6)
+            if "output" in s:
+                row["diffs"] = diff(s["output"], json.loads(_canonical(out)))
+            else:
+                row["diffs"] = [f"recorded error '{s.get('error')}' no longer raised"]
+        except Exception as e:
+            row["error"] = _error_name(e)
+            if "error" in s and s["error"] == row["error"]:
+                del row["error"]
+        report["stages"].append(row)
+    if end_to_end:
+        row = {"recorded_seconds": snap["total_seconds"], "diffs": []}
+        t0 = time.perf_counter()
+        try:
+            result = resolve(snap["entry"])(**snap["inputs"])
+        except Exception as e:
+            if snap.get("error") != _error_name(e):
+                row["error"] = _error_name(e)
+        else:
+            if "error" in snap:
+                row["diffs"] = [f"recorded error '{snap['error']}' no longer raised"]
+            else:
+                row["diffs"] = diff(snap["result"], json.loads(_canonical({k: v for k, v in result.items() if k not in RESULT_ONLY_KEYS})))
+        row["replay_seconds"] = round(time.perf_counter() - t0, 6)
+        report["end_to_end"] = row
+    return report
+
+def _snapshot_paths(args):
+    for p in args:
+        if os.path.isdir(p):
+            for name in sorted(os.listdir(p)):
+                if name.endswith(".json.gz"):
+                    yield os.path.join(p, name)
+        else:
+            yield p
+
+def _print_report(r, slower):
+    print(f"{r['run_id']} ({r['label']}){' [env changed]' if r['env_changed'] else ''}{' [recorded while profiling]' if r['profiled'] else ''}{' [recorded failure: ' + r['error'] + ']' if r.get('error') else ''}")
+    rows = r["stages"] + ([dict(r["end_to_end"], name="end-to-end")] if "end_to_end" in r else [])
+    for row in rows:
+        rec, rep = row["recorded_seconds"], row.get("replay_seconds")
+        timing = f"{rec*1000:9.2f}ms -> {rep*1000:9.2f}ms" if rep is not None else f"{rec*1000:9.2f}ms ->         -"
+        marks = []
+        if row.get("version_changed"):
+            marks.append("changed")
+        if rep is not None and rec > 0 and rep > rec * slower:
+            marks.append(f"slower x{rep/rec:.1f}")
+        if row.get("error"):
+            marks.append(f"error {row['error']}")
+        if row["diffs"]:
+            marks.append(f"{len(row['diffs'])} diff(s)")
+        print(f"  {row['name']:<14}{timing}  {' '.join(marks) or 'ok'}")
+        for d in row["diffs"]:
+            print(f"      {d}")
+
+if __name__ == "__main__":
+    # snapshot.py replay SNAPSHOT|DIR... [--end-to-end] [--slower X] [--json]
+    if len(sys.argv) < 3 or sys.argv[1] != "replay":
+        print("usage: snapshot.py replay SNAPSHOT|DIR... [--end-to-end] [--slower X] [--json]")
+        sys.exit(1)
+    end_to_end = as_json = False
+    slower = 1.5
+    paths = []
+    i = 2
+    while i < len(sys.argv):
+        if sys.argv[i] == "--end-to-end":
+            end_to_end = True
+            i += 1
+        elif sys.argv[i] == "--json":
+            as_json = True
+            i += 1
+        elif sys.argv[i] == "--slower" and i+1 < len(sys.argv):
+            slower = float(sys.argv[i+1])
+            i += 2
+        else:
+            paths.append(sys.argv[i])
+            i += 1
+    failed = 0
+    reports = []
+    for p in _snapshot_paths(paths):
+        r = replay(load_snapshot(p), end_to_end)
+        rows = r["stages"] + ([r["end_to_end"]] if "end_to_end" in r else [])
+        failed += any(row["diffs"] or row.get("error") for row in rows)
+        if as_json:
+            reports.append(r)
+        else:
+            _print_report(r, slower)
+    if as_json:
+        print(json.dumps(reports, indent=2, ensure_ascii=False))
+    print(f"{failed} snapshot(s) with differences", file=sys.stderr)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scheduler
+from scheduler import Scheduler
+
+
+class SchedulerFairnessTest(unittest.TestCase):
+    def _drain(self, s, jobs):
+        order = []
+        futs = [s.submit(tenant, "batch", order.append, tenant) for tenant in jobs]
+        s.start()
+        for f in futs:
+            f.result(timeout=10)
+        s.shutdown()
+        return order
+
+    def test_tenant_returning_from_solo_run_interleaves(self):
+        # one worker serves the batch lane, so dispatch order is deterministic
+        s = Scheduler(workers=2, reserved_interactive=1)
+        self._drain(s, ["A"] * 200)
+        order = self._drain(s, ["B"] * 50 + ["A"] * 50)
+        self.assertEqual(len(order), 100)
+        # interleaved dispatch never lets one tenant run far ahead of the other
+        for i in range(2, 101, 2):
+            prefix = order[:i]
+            self.assertLessEqual(abs(prefix.count("A") - prefix.count("B")), 2, prefix)
+
+    def test_new_tenant_cannot_starve_active_one(self):
+        s = Scheduler(workers=2, reserved_interactive=1)
+        self._drain(s, ["A"] * 100)
+        order = self._drain(s, ["A"] * 20 + ["C"] * 20)
+        self.assertLessEqual(abs(order[:20].count("A") - order[:20].count("C")), 2, order)
+
+    def test_idle_implicit_tenants_are_dropped(self):
+        s = Scheduler(workers=2, reserved_interactive=1)
+        s.configure_tenant("kept", weight=2.0)
+        self._drain(s, [f"t{i}" for i in range(50)])
+        saved = scheduler.TENANT_IDLE_SECONDS, scheduler.SWEEP_INTERVAL
+        scheduler.TENANT_IDLE_SECONDS = scheduler.SWEEP_INTERVAL = 0
+        try:
+            self._drain(s, ["fresh"])
+        finally:
+            scheduler.TENANT_IDLE_SECONDS, scheduler.SWEEP_INTERVAL = saved
+        self.assertEqual(set(s.metrics()["tenants"]), {"kept", "fresh"})
+
+    def test_sub_one_rate_tenant_runs(self):
+        s = Scheduler(workers=2, reserved_interactive=1, default_rate=0.5).start()
+        try:
+            self.assertEqual(s.submit("slow", "batch", lambda: 1).result(timeout=5), 1)
+        finally:
+            s.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
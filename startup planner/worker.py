@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import functools
+import socket
+import multiprocessing
+from broker import open_broker, DEFAULT_LEASE_SECONDS
+from run_store import SQLiteRunStore
+
+POLL_INTERVAL = 0.5
+LEASE_BATCH = 4
+
+def _pipelines():
+    # each worker process keeps its own similarity index; reuse is not shared across processes
+    from auto_startup_builder import run_pipeline, run_required_pipeline
+    from similarity_index import SimilarityIndex
+    return {"fusion": functools.partial(run_pipeline, similar=SimilarityIndex()), "required": run_required_pipeline}
+
+def make_job(idea, language=None, tone=None, pipeline="fusion", job_id=None):
+    job = {"idea": idea, "language": language or ("English" if pipeline == "fusion" else "EN"), "tone": tone, "pipeline": pipeline}
+    if job_id:
+        job["job_id"] = job_id
+    return job
+
+def process_job(job, store, pipelines):
+    # the job id doubles as the run id, so a job replayed after a crash finds its stored result
+    if store.has(job["id"]):
+        return False
+    req = job["payload"]
+    result = pipelines[req.get("pipeline", "fusion")](req["idea"], req.get("language"), req.get("tone"))
+    store.put(job["id"], req, result)
+    return True
+
+def run_worker(broker_url, store_path, worker_id=None, max_jobs=None, idle_exit=None, lease_seconds=DEFAULT_LEASE_SECONDS):
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    broker = open_broker(broker_url)
+    store = SQLiteRunStore(store_path)
+    pipelines = _pipelines()
+    done = 0
+    idle_since = time.monotonic()
+    while max_jobs is None or done < max_jobs:
+        jobs = broker.lease(worker_id, limit=LEASE_BATCH if max_jobs is None else min(LEASE_BATCH, max_jobs - done), lease_seconds=lease_seconds)
+        if not jobs:
+            if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                break
+            time.sleep(POLL_INTERVAL)
+            continue
+        for job in jobs:
+            try:
+                process_job(job, store, pipelines)
+            except Exception as e:
+                print(f"{worker_id}: job {job['id']} failed (attempt {job['attempts']}): {e}", file=sys.stderr)
+                broker.fail(job["id"], worker_id, e)
+                continue
+            broker.ack(job["id"], worker_id)
+            done += 1
+        idle_since = time.monotonic()
+    return done
+
+def run_workers(broker_url, store_path, processes=None, idle_exit=None):
+    processes = processes or os.cpu_count() or 1
+    procs = [multiprocessing.Process(target=run_worker, args=(broker_url, store_path), kwargs={"idle_exit": idle_exit}) for _ in range(processes)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    return [p.exitcode for p in procs]
+
+def main():
+    # worker.py submit BROKER IDEA [IDEA ...] | work BROKER STORE [--processes N] [--idle-exit S] | status BROKER
+    if len(sys.argv) < 3 or sys.argv[1] not in ("submit", "work", "status"):
+        print("usage: worker.py submit BROKER IDEA... | work BROKER STORE [--processes N] [--idle-exit S] | status BROKER")
+        sys.exit(1)
+    cmd, broker_url = sys.argv[1], sys.argv[2]
+    if cmd == "submit":
+        ids = open_broker(broker_url).enqueue_many([make_job(idea) for idea in sys.argv[3:]])
+        print("\n".join(ids))
+    elif cmd == "status":
+        print(open_broker(broker_url).stats())
+    else:
+        if len(sys.argv) < 4:
+            print("work needs a run store path")
+            sys.exit(1)
+        store_path = sys.argv[3]
+        processes = None
+        idle_exit = None
+        i = 4
+        while i < len(sys.argv):
+            if sys.argv[i] == "--processes" and i+1 < len(sys.argv):
+                processes = int(sys.argv[i+1])
+                i += 2
+            elif sys.argv[i] == "--idle-exit" and i+1 < len(sys.argv):
+                idle_exit = float(sys.argv[i+1])
+                i += 2
+            else:
+                i += 1
+        run_workers(broker_url, store_path, processes, idle_exit)
+
+if __name__ == "__main__":
+    main()